@@ -1,2 +1,2 @@
 __version__ = '1.41'
-from .pyjama import C_pyjama
+from .pyjama import C_pyjama, C_pyjama_reader, C_pyjama_writer, F_iter_entries, F_build_collection, F_read_columnar, C_pyjama_shard_store
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+@date: 2026/10/18
+
+@description:
+Benchmark of the pyjama API on synthetic collections.
+
+The synthetic collection (F_generate_collection) is defined by
+    - nb_entry: number of entries
+    - nb_description: number of descriptions (in addition to 'filepath'), cycling over
+        'global' text (value_in_dictionary), 'global' numeric, 'marker' numeric, 'segment' text (value_in_dictionary), 'breakpoint'
+    - dictionary_size: number of values of the 'value_in_dictionary' dictionaries
+    - nb_atom: number of atoms of the 'marker' and 'segment' descriptions of each entry
+    - breakpoint_length, breakpoint_dim: number of times and of dimensions of the 'breakpoint' descriptions
+
+F_run_benchmark measures each operation (time, throughput and peak memory measured with tracemalloc in a separate run)
+
+    python -m pyjama.benchmark --nb_entry 10000 --nb_description 10 --instrumentation
+"""
+
+import os
+import io
+import time
+import argparse
+import tempfile
+import tracemalloc
+import contextlib
+import numpy as np
+
+from . import pyjama
+
+
+def F_generate_definition(nb_description=5, dictionary_size=100, breakpoint_dim=1):
+    """
+    return the list of (description_name, M_add_definition arguments) of a synthetic collection
+    """
+
+    dictionary = ['label_%d' % num for num in range(dictionary_size)]
+    definition_l = [('filepath', {'type_constraint': 'free'})]
+    for num_description in range(nb_description):
+        kind = num_description % 5
+        if kind == 0:
+            definition_l.append((f'global_text_{num_description}', {'type_extent': 'global', 'type_content': 'text', 'type_constraint': 'value_in_dictionary', 'dictionary': dictionary}))
+        elif kind == 1:
+            definition_l.append((f'global_numeric_{num_description}', {'type_extent': 'global', 'type_content': 'numeric'}))
+        elif kind == 2:
+            definition_l.append((f'marker_{num_description}', {'type_extent': 'marker', 'type_content': 'numeric'}))
+        elif kind == 3:
+            definition_l.append((f'segment_{num_description}', {'type_extent': 'segment', 'type_content': 'text', 'type_constraint': 'value_in_dictionary', 'dictionary': dictionary}))
+        else:
+            definition_l.append((f'breakpoint_{num_description}', {'type_extent': 'breakpoint', 'type_content': 'numeric', 'row_name': ['dim_%d' % num for num in range(breakpoint_dim)]}))
+    return definition_l
+
+
+def F_generate_collection(nb_entry=1000, nb_description=5, dictionary_size=100, nb_atom=10, breakpoint_length=100, breakpoint_dim=1, seed=0):
+    """
+    Generate the values of a synthetic collection
+    return definition_l (see F_generate_definition) and entry_l,
+        entry_l[num_entry]: description_name -> list of M_update_entry arguments (one per atom)
+    """
+
+    rng = np.random.default_rng(seed)
+    definition_l = F_generate_definition(nb_description, dictionary_size, breakpoint_dim)
+    entry_l = []
+    for num_entry in range(nb_entry):
+        entry = {'filepath': [{'value_l': f'/synthetic/audio_{num_entry}.wav'}]}
+        for description_name, definition in definition_l[1:]:
+            type_extent = definition['type_extent']
+            if type_extent == 'global' and definition['type_content'] == 'text':
+                entry[description_name] = [{'value_l': definition['dictionary'][rng.integers(dictionary_size)]}]
+            elif type_extent == 'global':
+                entry[description_name] = [{'value_l': float(rng.random())}]
+            elif type_extent == 'marker':
+                time_v = np.sort(rng.random(nb_atom)) * 100.
+                entry[description_name] = [{'value_l': float(num_atom), 'time_l': float(time_v[num_atom])} for num_atom in range(nb_atom)]
+            elif type_extent == 'segment':
+                time_v = np.sort(rng.random(nb_atom)) * 100.
+                entry[description_name] = [{'value_l': definition['dictionary'][rng.integers(dictionary_size)], 'time_l': float(time_v[num_atom]), 'duration_l': 1.}
+                                           for num_atom in range(nb_atom)]
+            else:
+                entry[description_name] = [{'value_l': rng.random((breakpoint_dim, breakpoint_length)), 'time_l': np.arange(breakpoint_length) * 0.01}]
+        entry_l.append(entry)
+    return definition_l, entry_l
+
+
+def F_new_collection(definition_l, **option_d):
+    """
+    return an empty C_pyjama with the synthetic definitions (option_d: options of C_pyjama)
+    """
+
+    my_pyjama = pyjama.C_pyjama(**option_d)
+    for description_name, definition in definition_l:
+        definition = dict(definition)
+        if 'dictionary' in definition:
+            definition['dictionary'] = list(definition['dictionary'])
+        my_pyjama.M_add_definition(description_name, **definition)
+    return my_pyjama
+
+
+def F_add_update(my_pyjama, entry_l):
+    """
+    fill a collection entry by entry (M_add_entry, M_update_entry)
+    """
+
+    for entry in entry_l:
+        my_pyjama.M_add_entry()
+        for description_name, argument_l in entry.items():
+            for argument_d in argument_l:
+                my_pyjama.M_update_entry(description_name, **argument_d)
+
+
+def F_update_entries(my_pyjama, definition_l, entry_l):
+    """
+    fill a collection with the batch methods (M_add_entries, M_update_entries), the breakpoints with M_update_entry
+    """
+
+    nb_entry = len(entry_l)
+    first_entry = len(my_pyjama.data['collection']['entry'])
+    my_pyjama.M_add_entries(nb_entry)
+    for description_name, definition in definition_l:
+        if definition.get('type_extent', 'global') == 'breakpoint':
+            for num_entry, entry in enumerate(entry_l):
+                for argument_d in entry[description_name]:
+                    my_pyjama.M_update_entry(description_name, num_entry=first_entry + num_entry, **argument_d)
+            continue
+        argument_l = [argument_d for entry in entry_l for argument_d in entry[description_name]]
+        offset_v = np.cumsum([0] + [len(entry[description_name]) for entry in entry_l])
+        column_d = {}
+        for key in ['time_l', 'duration_l']:
+            if key in argument_l[0]:
+                column_d[key] = [argument_d[key] for argument_d in argument_l]
+        my_pyjama.M_update_entries(description_name, value_l=[argument_d['value_l'] for argument_d in argument_l], offset_v=offset_v, **column_d)
+
+
+def F_measure(F_setup, memory=True):
+    """
+    measure the function returned by F_setup() and return (duration in seconds, peak memory in bytes or None)
+        the peak memory is measured (with tracemalloc) in a second run (with a new state), so that tracemalloc does not change the duration
+    """
+
+    run = F_setup()
+    with contextlib.redirect_stdout(io.StringIO()):
+        time_start = time.perf_counter()
+        run()
+        duration = time.perf_counter() - time_start
+
+    peak = None
+    if memory:
+        run = F_setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            tracemalloc.start()
+            try:
+                run()
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    return duration, peak
+
+
+def F_run_benchmark(nb_entry=1000, nb_description=5, dictionary_size=100, nb_atom=10, breakpoint_length=100, breakpoint_dim=1,
+                    validate='full', memory=True, instrumentation=False, seed=0):
+    """
+    Measure the main operations of the pyjama API on a synthetic collection (see F_generate_collection)
+        validate: 'full' or 'trusted' (C_pyjama option)
+        memory: if True the peak memory of each operation is measured
+        instrumentation: if True the report of C_pyjama.M_start_instrumentation for the entry by entry filling is added
+    return the list of results {'operation', 'nb_item', 'time', 'throughput', 'peak_memory'} and the instrumentation report (or None)
+    """
+
+    definition_l, entry_l = F_generate_collection(nb_entry, nb_description, dictionary_size, nb_atom, breakpoint_length, breakpoint_dim, seed)
+    nb_atom_total = sum(len(argument_l) for entry in entry_l for argument_l in entry.values())
+    text_value_l = [argument_d['value_l'] for entry in entry_l for description_name, definition in definition_l
+                    if definition.get('type_constraint') == 'value_in_dictionary' for argument_d in entry[description_name]]
+    time_l = [[argument_d['time_l'] for argument_d in entry[description_name]] for entry in entry_l for description_name, definition in definition_l
+              if definition.get('type_extent') in ['marker', 'segment']]
+    dictionary = definition_l[1][1]['dictionary'] if nb_description > 0 else []
+
+    def F_filled(**option_d):
+        my_pyjama = F_new_collection(definition_l, validate=validate, **option_d)
+        with contextlib.redirect_stdout(io.StringIO()):
+            F_update_entries(my_pyjama, definition_l, entry_l)
+        return my_pyjama
+
+    tmp_dir = tempfile.mkdtemp()
+    fileName = os.path.join(tmp_dir, 'benchmark.pyjama')
+
+    # --- each setup function prepares a new state and returns the function to be measured
+    def F_setup_add_update():
+        my_pyjama = F_new_collection(definition_l, validate=validate)
+        return lambda: F_add_update(my_pyjama, entry_l)
+
+    def F_setup_update_entries():
+        my_pyjama = F_new_collection(definition_l, validate=validate)
+        return lambda: F_update_entries(my_pyjama, definition_l, entry_l)
+
+    def F_setup_check_value_in_dictionary():
+        dictionary_set = set(dictionary)
+        return lambda: [pyjama.F_check_value_in_dictionary([value], 'text', dictionary, 'reject', dictionary_set) for value in text_value_l]
+
+    def F_setup_numeric_input():
+        return lambda: [pyjama.F_numeric_input(numeric_l=time, check_vector=True, field_name='time') for time in time_l]
+
+    def F_setup_check():
+        return F_filled().M_check
+
+    def F_setup_save():
+        my_pyjama = F_filled()
+        return lambda: my_pyjama.M_save(fileName)
+
+    def F_setup_save_sidecar():
+        my_pyjama = F_filled(sidecar=True)
+        return lambda: my_pyjama.M_save(fileName + '.sidecar', compact=True, sidecar=True)
+
+    def F_setup_load():
+        return lambda: pyjama.C_pyjama().M_load(fileName)
+
+    operation_l = [('M_add_entry + M_update_entry', nb_atom_total, F_setup_add_update),
+                   ('M_add_entries + M_update_entries', nb_atom_total, F_setup_update_entries),
+                   ('F_check_value_in_dictionary', len(text_value_l), F_setup_check_value_in_dictionary),
+                   ('F_numeric_input', len(time_l), F_setup_numeric_input),
+                   ('M_check', nb_entry, F_setup_check),
+                   ('M_save', nb_entry, F_setup_save),
+                   ('M_save (compact, sidecar)', nb_entry, F_setup_save_sidecar),
+                   ('M_load', nb_entry, F_setup_load)]
+
+    result_l = []
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            F_filled().M_save(fileName)
+        for operation, nb_item, F_setup in operation_l:
+            duration, peak = F_measure(F_setup, memory)
+            result_l.append({'operation': operation,
+                             'nb_item': nb_item,
+                             'time': duration,
+                             'throughput': nb_item / duration if duration > 0 else float('inf'),
+                             'peak_memory': peak})
+
+        report = None
+        if instrumentation:
+            my_pyjama = F_new_collection(definition_l, validate=validate)
+            my_pyjama.M_start_instrumentation()
+            with contextlib.redirect_stdout(io.StringIO()):
+                F_add_update(my_pyjama, entry_l)
+                my_pyjama.M_check()
+                my_pyjama.M_save(fileName)
+            report = my_pyjama.M_stop_instrumentation().M_report()
+    finally:
+        for name in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, name))
+        os.rmdir(tmp_dir)
+
+    return result_l, report
+
+
+def F_print_result(result_l):
+    """
+    """
+
+    print('%-36s %10s %10s %14s %12s' % ('operation', 'nb_item', 'time (s)', 'item/s', 'peak (MB)'))
+    for result in result_l:
+        peak = '%12.2f' % (result['peak_memory'] / 1e6) if result['peak_memory'] is not None else '%12s' % '-'
+        print('%-36s %10d %10.4f %14.0f %s' % (result['operation'], result['nb_item'], result['time'], result['throughput'], peak))
+
+
+def F_main(argv=None):
+    """
+    """
+
+    parser = argparse.ArgumentParser(description='Benchmark of the pyjama API on a synthetic collection')
+    parser.add_argument('--nb_entry', type=int, default=1000)
+    parser.add_argument('--nb_description', type=int, default=5)
+    parser.add_argument('--dictionary_size', type=int, default=100)
+    parser.add_argument('--nb_atom', type=int, default=10)
+    parser.add_argument('--breakpoint_length', type=int, default=100)
+    parser.add_argument('--breakpoint_dim', type=int, default=1)
+    parser.add_argument('--validate', choices=['full', 'trusted'], default='full')
+    parser.add_argument('--no_memory', action='store_true', help='do not measure the peak memory')
+    parser.add_argument('--instrumentation', action='store_true', help='print the calls and timings of the entry by entry filling')
+    param = parser.parse_args(argv)
+
+    result_l, report = F_run_benchmark(nb_entry=param.nb_entry, nb_description=param.nb_description, dictionary_size=param.dictionary_size,
+                                       nb_atom=param.nb_atom, breakpoint_length=param.breakpoint_length, breakpoint_dim=param.breakpoint_dim,
+                                       validate=param.validate, memory=not param.no_memory, instrumentation=param.instrumentation)
+    F_print_result(result_l)
+    if report is not None:
+        print()
+        print(report)
+
+
+if __name__ == '__main__':
+    F_main()
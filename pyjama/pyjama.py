@@ -56,17 +56,39 @@ version 1.2
 2024/03/05: Change compatibility to python 3 -> changed print
             Removed 'encoding' in json_dump
 2024/10/19: Change orientation of data in breakpoint mode 
+2026/10/18: Added M_load and streaming reading of entries (C_pyjama_reader, F_iter_entries)
+2026/10/18: Added streaming writing of entries (C_pyjama_writer, M_flush) and compact mode for M_save
+2026/10/18: Added sidecar storage of breakpoint values (binary file next to the .pyjama file, read back as np.memmap)
+2026/10/18: Definitions are compiled into C_description when added, added validate='full'|'trusted' to M_update_entry
+2026/10/18: 'value_in_dictionary' uses a set index of the dictionary (text) and a vectorized range check (numeric)
+2026/10/18: Added batch ingestion (M_add_entries, M_update_entries)
+2026/10/18: 'data' is now an instance attribute (instances do not share their data anymore),
+            added M_merge and F_build_collection (building of a collection over a process pool)
+2026/10/18: Added M_select (queries on the values of the 'is_filter' descriptions using inverted indexes)
+2026/10/18: Added M_find_time (time queries on 'marker' and 'segment' descriptions using temporal indexes)
+2026/10/18: Added columnar (struct-of-arrays) conversion of the collection (M_to_columnar, M_from_columnar) and .npz storage
+2026/10/18: 'filepath' constraint is checked with a cache (C_filepath_checker), added deferred bulk checking (M_check_filepath)
+2026/10/18: Added journal of the operations (M_open_journal, M_checkpoint, M_replay, M_compact)
+2026/10/18: Added sharded collections with an index of the entries (M_save_sharded, M_open_sharded, M_get_entry, C_pyjama_shard_store)
+2026/10/18: Updates can target any entry (num_entry or 'filepath' key index), added M_replace_atom and M_delete_atom
+2026/10/18: M_check only checks the entries and definitions changed since its last call, added fill='lazy' (M_iter_entries)
+2026/10/18: Added min/max/mean pyramids of the breakpoint values (M_build_pyramid, M_save(pyramid=True)) and M_get_breakpoint
+2026/10/18: Added import of directories of .lab files (M_import_lab, F_read_lab)
+2026/10/18: Added opt-in instrumentation (M_start_instrumentation, C_instrumentation) and the benchmark module (benchmark.py)
 """
 
 import sys
 import os
 import json
+import shutil
+import time
 import glob
 import pprint as pp
 #import ipdb
 import copy
 import numpy as np
 import collections
+import concurrent.futures
 
 
 def F_backward_compatibility(entry):
@@ -75,27 +97,47 @@ def F_backward_compatibility(entry):
     """
     #return entry
 
+    if isinstance(entry, np.ndarray): # --- sidecar storage: arrays are kept as they are
+        return entry
     if len(entry) == 1:
         if type(entry[0]) is not list:
             entry = entry[0]
     return entry
 
 
+def F_has_value(value_l):
+    """
+    truth value of a list, a scalar or a np.ndarray (which is ambiguous for np.ndarray)
+    """
+
+    if isinstance(value_l, np.ndarray):
+        return value_l.size > 0
+    return bool(value_l)
+
+
 def F_numeric_input(numeric_l=[], 
                     check_vector=False, 
                     prefix='', 
-                    field_name=''):
+                    field_name='',
+                    keep_array=False):
     """
     check and transform numerical value to list of float
+    keep_array: IF True THEN a np.ndarray is returned as a vector (np.ndarray) instead of a list
+    prefix: error message prefix, or function returning it (only called in case of error)
     """
 
+    if type(numeric_l) is list and len(numeric_l) == 0:
+        return numeric_l
+
+    F_prefix = prefix if callable(prefix) else lambda: prefix
+
     if type(numeric_l) not in [float, list, np.ndarray]:
-        raise Exception(f"{prefix} '{field_name}' must be float, list or np.ndarray")
+        raise Exception(f"{F_prefix()} '{field_name}' must be float, list or np.ndarray")
 
     if isinstance(numeric_l, list):
         for numeric in numeric_l:
             if not isinstance(numeric, float):
-                raise Exception(f"{prefix} all elements of '{field_name}' list must be float")
+                raise Exception(f"{F_prefix()} all elements of '{field_name}' list must be float")
 
 
     if isinstance(numeric_l, float):
@@ -105,50 +147,91 @@ def F_numeric_input(numeric_l=[],
         if check_vector:
             if numeric_l.ndim == 2:
                 if (numeric_l.shape[0] > 1) and (numeric_l.shape[0] > 1):
-                    raise Exception(f"{prefix} '{field_name}' cannot be a matrix")
+                    raise Exception(f"{F_prefix()} '{field_name}' cannot be a matrix")
                 elif (numeric_l.shape[0] == 1) and (numeric_l.shape[0] > 1):
                     numeric_l = numeric_l[0, :]
                 else:
                     numeric_l = numeric_l[:, 0]
-            numeric_l = numeric_l.tolist()
+            if keep_array:
+                numeric_l = np.ascontiguousarray(numeric_l)
+            else:
+                numeric_l = numeric_l.tolist()
 
     return numeric_l
 
 
+def F_numeric_list(numeric_l):
+    """
+    transform numerical value to list (without check, see F_numeric_input)
+    """
+
+    if type(numeric_l) is list:
+        return numeric_l
+    if isinstance(numeric_l, (float, int)):
+        return [numeric_l]
+    if isinstance(numeric_l, np.ndarray):
+        return numeric_l.ravel().tolist()
+    return numeric_l
+
+
 def F_check_value_in_dictionary(value_l,
                                 current_type_content,
                                 dictionary,
-                                not_valid_action):
+                                not_valid_action,
+                                dictionary_set=None):
     """
+    check that the values are part of the dictionary ('text') or inside the [min, max] range of the dictionary ('numeric')
+    IF not_valid_action == 'add_to_dictionary' THEN the dictionary is updated (in place)
+        dictionary_set: set of the values of dictionary (for 'text'), updated together with dictionary
     """
+
+    if current_type_content == 'numeric':
+        try:
+            value_v = np.asarray(value_l, dtype=float).ravel()
+        except (ValueError, TypeError):
+            # --- ragged list of list
+            value_v = np.asarray([item for sublist in value_l for item in (sublist if isinstance(sublist, list) else [sublist])], dtype=float)
+        if value_v.size == 0:
+            return True, dictionary
+
+        if len(dictionary) < 2:
+            if not_valid_action != 'add_to_dictionary':
+                return False, dictionary
+            dictionary[:] = [float(value_v.min()), float(value_v.max())]
+            return True, dictionary
+
+        min_value = dictionary[0]
+        max_value = dictionary[1]
+        value_min = value_v.min()
+        value_max = value_v.max()
+        if (value_min < min_value) or (max_value < value_max):
+            if not_valid_action == 'add_to_dictionary':
+                if value_min < min_value:
+                    dictionary[0] = float(value_min)
+                if value_max > max_value:
+                    dictionary[1] = float(value_max)
+            else:
+                return False, dictionary
+        return True, dictionary
+
     flatten_value_l = value_l
     if isinstance(value_l, list):
-        if isinstance(value_l[0], list): # --- 2024/10/19
+        if value_l and isinstance(value_l[0], list): # --- 2024/10/19
             # --- flatten value: in case it is a list of list, it is changed to a list
             flatten_value_l = [item for sublist in value_l for item in sublist]
     else:
         flatten_value_l = [value_l]
 
+    if dictionary_set is None:
+        dictionary_set = set(dictionary)
+
     is_valid = True
     for value in flatten_value_l:
-
-        if current_type_content == 'text':
-            if value not in dictionary:
-                if not_valid_action == 'add_to_dictionary':
-                    print(f"'value'({value}) is not part of dictionary ->  updating dictionary")
-                    dictionary.append(value)
-                else:
-                    is_valid = False
-
-        elif current_type_content == 'numeric':
-            min_value = dictionary[0]
-            max_value = dictionary[1]
-            if (value < min_value) or (max_value < value):
-                if not_valid_action == 'add_to_dictionary':
-                    if value < min_value:
-                        dictionary[0] = value
-                    if value > max_value:
-                        dictionary[1] = value
+        if value not in dictionary_set:
+            if not_valid_action == 'add_to_dictionary':
+                print(f"'value'({value}) is not part of dictionary ->  updating dictionary")
+                dictionary.append(value)
+                dictionary_set.add(value)
             else:
                 is_valid = False
 
@@ -156,295 +239,3369 @@ def F_check_value_in_dictionary(value_l,
 
 
 
-class C_pyjama():
+class C_pyjama_reader():
     """
+    Streaming reader of a pyjama file
+        'schemaversion' and 'descriptiondefinition' are parsed when the reader is created,
+        the entries are then parsed (and yielded) one at a time when iterating over the reader,
+        so that memory is bounded by the size of a single entry (not by the size of the file)
+
+    with C_pyjama_reader(fileName) as reader:
+        print(reader.descriptiondefinition.keys())
+        for entry in reader:
+            ...
+
+    The breakpoint values stored in a sidecar file (see C_pyjama_writer) are returned as np.memmap views (no copy)
     """
 
-    data = {}
-    current_position = -1
-    not_valid_action = '' # ---- decide how to deal with values which are not in dictionary
+    # ===============================================
+    def __init__(self, fileName, chunk_size=1<<16):
+        """
+        """
+
+        self.fileName = fileName
+        self.memmap_d = {}
+        self.chunk_size = chunk_size
+        self.schemaversion = None
+        self.descriptiondefinition = None
+        self.is_consumed = False
+
+        self.fid = open(fileName, 'r')
+        self.buffer = ''
+        self.pos = 0
+        self.is_eof = False
+        self.decoder = json.JSONDecoder()
+
+        # --- parse the header up to the beginning of the 'entry' list
+        self.M_expect('{')
+        while True:
+            key = self.M_read_key()
+            if key is None:
+                # --- no 'entry' in the file
+                self.is_consumed = True
+                break
+            if key == 'collection':
+                self.M_expect('{')
+                if self.M_read_collection_header():
+                    break
+                # --- 'collection' without 'entry'
+                self.is_consumed = True
+            else:
+                value = self.M_read_value()
+                if key == 'schemaversion':
+                    self.schemaversion = value
+
+        if self.descriptiondefinition is None:
+            raise Exception(f"ERROR reading {fileName}: no 'descriptiondefinition' before 'entry' in 'collection'")
+
+
+    # ===============================================
+    def __enter__(self):
+        return self
+
+
+    # ===============================================
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.M_close()
 
 
     # ===============================================
-    def __init__(self, not_valid_action='add_to_dictionary'):
+    def __iter__(self):
         """
+        yield the entries one at a time
         """
 
-        self.data['schemaversion'] = '1.41'
-        self.data['collection'] = {'descriptiondefinition': {}, 'entry': []}
-        if not_valid_action in ['add_to_dictionary', 'filter_out', 'reject']:
-            self.not_valid_action = not_valid_action
-        else:
-            raise Exception(f'Problem creating "pyjama" structure: unknown type "{not_valid_action}" for not_valid_action')
+        if self.is_consumed:
+            return
+        self.is_consumed = True
+
+        if self.M_peek() == ']':
+            self.pos += 1
+            return
+        sidecar_name_l = [description_name for description_name, definition in self.descriptiondefinition.items()
+                          if definition.get('type_extent') in SIDECAR_EXTENT_L]
+        while True:
+            entry = self.M_read_value()
+            if sidecar_name_l:
+                self.M_resolve_sidecar(entry, sidecar_name_l)
+            yield entry
+            char = self.M_peek()
+            self.pos += 1
+            if char == ']':
+                return
+            elif char != ',':
+                raise Exception(f"ERROR reading {self.fileName}: expecting ',' or ']' in 'entry' and got '{char}'")
 
 
     # ===============================================
-    def __setattr__(self, attr_name, attr_val):
+    def M_close(self):
         """
         """
 
-        if hasattr(self, attr_name):
-            self.__dict__[attr_name] = attr_val
-        else:
-            raise Exception(f"self.{attr_name} note part of the fields")
+        self.fid.close()
 
 
     # ===============================================
-    def M_add_definition(self, 
-                        description_name, 
-                        type_constraint='free', 
-                        type_content='text',
-                        type_extent='global', 
-                        #column_name=[],  # --- 2024/10/19
-                        row_name=[], # --- 2024/10/19
-                        generator={},
-                        dictionary=[], 
-                        is_table=True, 
-                        is_editable=True,
-                        is_filter=True):
+    def M_resolve_sidecar(self, entry, sidecar_name_l):
         """
+        replace (in place) the sidecar references of entry by np.memmap views
         """
 
-        self.data['collection']['descriptiondefinition'][description_name] = collections.OrderedDict()
+        for description_name in sidecar_name_l:
+            for atom in entry.get(description_name, []):
+                for key in SIDECAR_KEY_L:
+                    if F_is_sidecar_reference(atom.get(key)):
+                        atom[key] = self.M_read_array(atom[key])
+                if 'pyramid' in atom:
+                    for level in atom['pyramid']['level']:
+                        for key in PYRAMID_KEY_L:
+                            if F_is_sidecar_reference(level.get(key)):
+                                level[key] = self.M_read_array(level[key])
 
-        if type_content in ['text', 'numeric']:
-            self.data['collection']['descriptiondefinition'][description_name]['type_content'] = type_content
-        else:
-            raise Exception(f'unknown type "{type_content}" for type_content')
 
-        if type_extent in ['global', 'segment', 'marker', 'breakpoint', 'breakpoint_time', 'breakpoint_value']:
-            self.data['collection']['descriptiondefinition'][description_name]['type_extent'] = type_extent
-        else:
-            raise Exception(f'unknown type "{type_extent}" for type_extent')
+    # ===============================================
+    def M_read_array(self, reference):
+        """
+        """
 
-        if type_constraint in ['filepath', 'free', 'value_in_dictionary']:
-            self.data['collection']['descriptiondefinition'][description_name]['type_constraint'] = type_constraint
+        dtype = np.dtype(reference['dtype'])
+        shape = tuple(reference['shape'])
+        nb_byte = dtype.itemsize * int(np.prod(shape))
+        if nb_byte == 0:
+            return np.zeros(shape, dtype=dtype)
+
+        if reference['sidecar'] not in self.memmap_d:
+            sidecar_fileName = os.path.join(os.path.dirname(self.fileName), reference['sidecar'])
+            self.memmap_d[reference['sidecar']] = np.memmap(sidecar_fileName, dtype=np.uint8, mode='r')
+        memmap = self.memmap_d[reference['sidecar']]
+        offset = reference['offset']
+        return memmap[offset:offset+nb_byte].view(dtype).reshape(shape)
+
+
+    # ===============================================
+    def M_read_collection_header(self):
+        """
+        parse the keys of 'collection' until 'entry' is found
+        return True if the reader is positioned on the first element of 'entry'
+        """
+
+        while True:
+            key = self.M_read_key()
+            if key is None:
+                return False
+            if key == 'entry':
+                self.M_expect('[')
+                return True
+            value = self.M_read_value()
+            if key == 'descriptiondefinition':
+                self.descriptiondefinition = value
+
+
+    # ===============================================
+    def M_fill(self):
+        """
+        read the next chunk of the file into the buffer (dropping the already parsed part)
+        """
+
+        chunk = self.fid.read(self.chunk_size)
+        if not chunk:
+            self.is_eof = True
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return bool(chunk)
+
+
+    # ===============================================
+    def M_peek(self):
+        """
+        return the next non-whitespace character (without consuming it)
+        """
+
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\n\r':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.M_fill():
+                raise Exception(f"ERROR reading {self.fileName}: unexpected end of file")
+
+
+    # ===============================================
+    def M_expect(self, char):
+        """
+        """
+
+        if self.M_peek() != char:
+            raise Exception(f"ERROR reading {self.fileName}: expecting '{char}' and got '{self.buffer[self.pos]}'")
+        self.pos += 1
+
+
+    # ===============================================
+    def M_read_key(self):
+        """
+        read the next 'key': of the current object, return None at the end of the object
+        """
+
+        char = self.M_peek()
+        if char == ',':
+            self.pos += 1
+            char = self.M_peek()
+        if char == '}':
+            self.pos += 1
+            return None
+        key = self.M_read_value()
+        self.M_expect(':')
+        return key
+
+
+    # ===============================================
+    def M_read_value(self):
+        """
+        decode the next json value, reading more of the file until it is complete
+        """
+
+        self.M_peek()
+        chunk_size = self.chunk_size
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # --- a value ending at the end of the buffer may be truncated, as a number followed only by number characters ("1." of "1.4")
+                tail = end
+                if type(value) in (int, float):
+                    while tail < len(self.buffer) and self.buffer[tail] in '0123456789.eE+-':
+                        tail += 1
+                if tail < len(self.buffer) or self.is_eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.is_eof:
+                    raise
+            # --- grow the read size to keep the re-parsing cost linear for large entries
+            chunk = self.fid.read(chunk_size)
+            chunk_size *= 2
+            if not chunk:
+                self.is_eof = True
+            self.buffer = self.buffer[self.pos:] + chunk
+            self.pos = 0
+
+
+
+def F_json_default(obj):
+    """
+    convert the numpy objects which are not json serializable
+    """
+
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+SIDECAR_EXTENT_L = ['breakpoint', 'breakpoint_time', 'breakpoint_value']
+SIDECAR_KEY_L = ['value', 'time']
+PYRAMID_KEY_L = ['min', 'max', 'mean']
+
+
+def F_journal_default(obj):
+    """
+    json conversion of the numpy objects for the journal (np.ndarray are restored by F_journal_object_hook)
+    """
+
+    if isinstance(obj, np.ndarray):
+        return {'__ndarray__': obj.tolist(), 'dtype': obj.dtype.str}
+    return F_json_default(obj)
+
+
+def F_journal_object_hook(obj):
+    """
+    """
+
+    if '__ndarray__' in obj:
+        return np.asarray(obj['__ndarray__'], dtype=obj['dtype'])
+    return obj
+
+
+def F_sidecar_fileName(fileName):
+    """
+    name of the binary file storing the breakpoint values of a pyjama file
+    """
+
+    return fileName + '.bin'
+
+
+COLUMNAR_KEY_L = ['time', 'duration', 'confidence', 'start_freq', 'end_freq']
+
+
+def F_is_sidecar_reference(value):
+    """
+    """
+
+    return isinstance(value, dict) and 'sidecar' in value
+
+
+
+class C_pyjama_writer():
+    """
+    Streaming writer of a pyjama file
+        'schemaversion' and 'descriptiondefinition' are written when the writer is created,
+        each entry is then written to disk as soon as it is given to M_write_entry,
+        so that memory is bounded by the size of a single entry (not by the size of the collection)
+    If 'descriptiondefinition' has changed when closing the writer (for example a dictionary updated with 'add_to_dictionary'),
+    the header is re-written
+
+    with C_pyjama_writer(fileName, my_pyjama, compact=True) as writer:
+        writer.M_write_entry(entry)
+
+    compact=False gives the same output as json.dump(data, indent=4)
+    compact=True removes indentation and writes one entry per line
+    sidecar=True writes the 'value' and 'time' of 'breakpoint', 'breakpoint_time' and 'breakpoint_value' descriptions
+        as raw arrays in a binary file (see F_sidecar_fileName); the json then only contains a reference
+        {'sidecar': file, 'offset': byte_offset, 'shape': shape, 'dtype': dtype}
+    """
+
+    # ===============================================
+    def __init__(self, fileName, descriptiondefinition, schemaversion='1.41', compact=False, sidecar=False, sidecar_fileName=None):
+        """
+        descriptiondefinition: dictionary of the description definitions or C_pyjama (its definitions and schemaversion are then used)
+        sidecar_fileName: name of the sidecar file (default: F_sidecar_fileName(fileName))
+        """
+
+        if isinstance(descriptiondefinition, C_pyjama):
+            schemaversion = descriptiondefinition.data['schemaversion']
+            descriptiondefinition = descriptiondefinition.data['collection']['descriptiondefinition']
+
+        self.fileName = fileName
+        self.descriptiondefinition = descriptiondefinition
+        self.schemaversion = schemaversion
+        self.compact = compact
+        self.nb_entry = 0
+
+        self.sidecar_fid = None
+        if sidecar:
+            # --- written in a temporary file: the previous sidecar may still be memory-mapped
+            self.sidecar_fileName = sidecar_fileName if sidecar_fileName is not None else F_sidecar_fileName(fileName)
+            self.sidecar_fid = open(self.sidecar_fileName + '.tmp', 'wb')
+            self.sidecar_offset = 0
+
+        if compact:
+            self.json_param_d = {'separators': (',', ':'), 'default': F_json_default}
+            self.entry_start = '\n'
         else:
-            raise Exception(f'unknown type "{type_constraint}" for type_constraint')
+            self.json_param_d = {'indent': 4, 'default': F_json_default}
+            self.entry_start = '\n' + ' ' * 12
 
-        self.data['collection']['descriptiondefinition'][description_name]['dictionary'] = copy.copy(dictionary)
-        #self.data['collection']['descriptiondefinition'][description_name]['column_name'] = copy.copy(column_name) # --- 2024/10/19
-        self.data['collection']['descriptiondefinition'][description_name]['row_name'] = copy.copy(row_name) # --- 2024/10/19
-        self.data['collection']['descriptiondefinition'][description_name]['is_table'] = is_table
-        self.data['collection']['descriptiondefinition'][description_name]['is_editable'] = is_editable
-        self.data['collection']['descriptiondefinition'][description_name]['is_filter'] = is_filter
-        if len(generator):
-            self.data['collection']['descriptiondefinition'][description_name]['generator'] = generator
+        self.fid = open(fileName, 'wb')
+        self.header = self.M_header()
+        self.fid.write(self.header.encode('utf-8'))
 
 
     # ===============================================
-    def M_add_entry(self):
+    def __enter__(self):
+        return self
+
+
+    # ===============================================
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.M_close()
+
+
+    # ===============================================
+    def M_header(self):
         """
         """
 
-        entry = {}
-        for description_name in self.data['collection']['descriptiondefinition'].keys():
-            entry[description_name] = []
-        self.data['collection']['entry'].append(entry)
-        self.current_position += 1
+        schemaversion = json.dumps(self.schemaversion, **self.json_param_d)
+        descriptiondefinition = json.dumps(self.descriptiondefinition, **self.json_param_d)
+        if self.compact:
+            return '{"schemaversion":' + schemaversion + ',"collection":{"descriptiondefinition":' + descriptiondefinition + ',"entry":['
+        descriptiondefinition = descriptiondefinition.replace('\n', '\n' + ' ' * 8)
+        return '{\n    "schemaversion": ' + schemaversion + ',\n    "collection": {\n        "descriptiondefinition": ' + descriptiondefinition + ',\n        "entry": ['
 
 
     # ===============================================
-    def M_update_entry(self, 
-                        description_name,
-                        value_l=[],
-                        confidence_l=[],
-                        time_l=[],
-                        duration_l=[],
-                        start_freq_l=[], 
-                        end_freq_l=[], 
-                        comment=''):
+    def M_write_array(self, value):
+        """
+        write a numeric array in the sidecar file and return its reference
+        return value unchanged if it is not a numeric array
         """
+
+        if isinstance(value, (list, np.ndarray)):
+            try:
+                value_m = np.asarray(value)
+            except ValueError:
+                return value
+            if value_m.dtype.kind in 'iuf' and value_m.ndim > 0:
+                # --- 8 bytes alignment of each array
+                padding = -self.sidecar_offset % 8
+                if padding:
+                    self.sidecar_fid.write(b'\0' * padding)
+                    self.sidecar_offset += padding
+                value_m = np.ascontiguousarray(value_m)
+                reference = {'sidecar': os.path.basename(self.sidecar_fileName),
+                             'offset': self.sidecar_offset,
+                             'shape': list(value_m.shape),
+                             'dtype': value_m.dtype.str}
+                self.sidecar_fid.write(value_m.tobytes())
+                self.sidecar_offset += value_m.nbytes
+                return reference
+        return value
+
+
+    # ===============================================
+    def M_write_sidecar(self, entry):
+        """
+        return a copy of entry in which the breakpoint arrays are replaced by their reference in the sidecar file
+        """
+
+        sidecar_entry = {}
+        for description_name, atom_l in entry.items():
+            definition = self.descriptiondefinition.get(description_name)
+            if definition is not None and definition['type_extent'] in SIDECAR_EXTENT_L:
+                sidecar_atom_l = []
+                for atom in atom_l:
+                    atom = dict(atom)
+                    for key in SIDECAR_KEY_L:
+                        if key in atom:
+                            atom[key] = self.M_write_array(atom[key])
+                    if 'pyramid' in atom:
+                        atom['pyramid'] = {'factor': atom['pyramid']['factor'],
+                                           'level': [{key: self.M_write_array(level[key]) for key in PYRAMID_KEY_L}
+                                                     for level in atom['pyramid']['level']]}
+                    sidecar_atom_l.append(atom)
+                atom_l = sidecar_atom_l
+            sidecar_entry[description_name] = atom_l
+        return sidecar_entry
+
+
+    # ===============================================
+    def M_write_entry(self, entry):
         """
-        prefix = f"ERROR updating self.data['collection']['entry'][{len(self.data['collection']['entry'])}]['{description_name}']:\n\t"
+        """
+
+        if self.sidecar_fid is not None:
+            entry = self.M_write_sidecar(entry)
+        text = json.dumps(entry, **self.json_param_d)
+        if not self.compact:
+            text = text.replace('\n', self.entry_start)
+        if self.nb_entry:
+            text = ',' + self.entry_start + text
+        else:
+            text = self.entry_start + text
+        self.fid.write(text.encode('utf-8'))
+        self.nb_entry += 1
+
 
-        if description_name not in self.data['collection']['descriptiondefinition'].keys():
+    # ===============================================
+    def M_close(self):
+        """
+        """
 
-            raise Exception(f"{prefix} '{description_name}' is not part of 'descriptiondefinition' -> add it first in 'descriptiondefinition'")
+        if self.fid.closed:
+            return
 
+        if self.compact:
+            footer = '\n]}}' if self.nb_entry else ']}}'
         else:
+            footer = '\n        ]\n    }\n}' if self.nb_entry else ']\n    }\n}'
+        self.fid.write(footer.encode('utf-8'))
+        header_end = len(self.header.encode('utf-8'))
+        self.fid.close()
 
-            current_type_extent = self.data['collection']['descriptiondefinition'][description_name]['type_extent']
-            current_type_content = self.data['collection']['descriptiondefinition'][description_name]['type_content']
-            current_type_constraint = self.data['collection']['descriptiondefinition'][description_name]['type_constraint']
+        if self.sidecar_fid is not None:
+            self.sidecar_fid.close()
+            os.replace(self.sidecar_fileName + '.tmp', self.sidecar_fileName)
 
-            if current_type_extent in ['global', 'marker', 'segment', 'breakpoint', 'breakpoint_time', 'breakpoint_value']:
-                # --- check VALUE
+        header = self.M_header()
+        if header != self.header:
+            # --- 'descriptiondefinition' has changed while writing -> copy the entries after the new header
+            tmp_fileName = self.fileName + '.tmp'
+            with open(tmp_fileName, 'wb') as fid_out, open(self.fileName, 'rb') as fid_in:
+                fid_out.write(header.encode('utf-8'))
+                fid_in.seek(header_end)
+                shutil.copyfileobj(fid_in, fid_out)
+            os.replace(tmp_fileName, self.fileName)
+            self.header = header
 
-                if type(value_l) not in [str, int, float, list, np.ndarray]:
-                    raise Exception(f"{prefix} 'value' must be str, int, float, list or np.ndarray")
 
-                if type(value_l) in [str, float, int]:
-                    value_l = [value_l]
 
-                elif type(value_l) is np.ndarray:
-                    if value_l.ndim != 2:
-                        raise Exception(f"{prefix} IF 'value' is np.ndarray THEN it must be have value.ndim == 2")
-                    # --- value (nb_dim, nb_time) -> [ [allDim(Time1)] [allDim(Time2)] [allDim(Time3)] [allDim(Time4)] ]
-                    #value_l = value_l.T.tolist() # --- 2024/10/19
-                    value_l = value_l.tolist() # --- 2024/10/19
+def F_iter_entries(fileName):
+    """
+    yield the entries of a pyjama file one at a time (see C_pyjama_reader)
+    """
 
-                if current_type_extent in ['breakpoint', 'breakpoint_value']:
-#                    nb_column_name = len(self.data['collection']['descriptiondefinition'][description_name]['column_name'])
-#                    if len(value_l[0]) != nb_column_name:
-#                        raise Exception("%s nb_dim of 'value' (%d) must be equal to nb_column_name' (%d)" % (prefix, len(value_l[0]), nb_column_name))
-                    nb_row_name = len(self.data['collection']['descriptiondefinition'][description_name]['row_name'])
-                    if len(value_l) != nb_row_name: # --- 2024/10/19
-                        raise Exception(f"{prefix} nb_dim of 'value' ({len(value_l[0])}) must be equal to nb_row_name' ({nb_row_name})")
+    with C_pyjama_reader(fileName) as reader:
+        for entry in reader:
+            yield entry
 
-                if current_type_constraint == 'free':
-                    is_valid = True
 
-                elif current_type_constraint == 'filepath':
-                    is_valid = True
-                    for value in value_l:
-                        if not(os.path.isfile(value)):
-                            is_valid = False
-                elif current_type_constraint == 'value_in_dictionary':
-                    is_valid, dictionary = F_check_value_in_dictionary(value_l, current_type_content, self.data['collection']['descriptiondefinition'][description_name]['dictionary'], self.not_valid_action)
 
+SHARD_MANIFEST_NAME = 'manifest.json'
+SHARD_INDEX_NAME = 'index.npz' # ---- index of the collections saved without 'generation' in their manifest
 
 
-            if current_type_extent in ['marker', 'segment', 'breakpoint']:
-                """ check TIME """
+def F_shard_fileName(num_shard, generation):
+    """
+    name of the file storing the entries of a shard of a sharded collection (generation: number of the save)
+    """
 
-                time_l = F_numeric_input(numeric_l=time_l, check_vector=True, prefix=prefix, field_name='time')
-                if len(time_l) > 1: # WASABI exception
-                    #if len(time_l) != len(value_l): # --- 2024/10/19
-#                        raise Exception(f"{prefix} len('time'): {len(time_l)} must be equal to len('value'): {len(value_l)}")
-                    if len(time_l) != len(value_l[0]):
-                        raise Exception(f"{prefix} len('time'): {len(time_l)} must be equal to len('value'): {len(value_l[0])}")
+    return 'shard_%05d_%05d.jsonl' % (generation, num_shard)
 
 
+def F_shard_index_fileName(generation):
+    """
+    name of the file storing the index of the entries of a sharded collection (generation: number of the save)
+    """
 
-            if current_type_extent in ['segment']:
-                """ check DURATION """
+    return 'index_%05d.npz' % generation
 
-                duration_l = F_numeric_input(numeric_l=duration_l, check_vector=True, prefix=prefix, field_name='duration')
 
-                if len(time_l) > 1: # WASABI exception
-                    if len(time_l) != len(duration_l):
-                        raise Exception(f"{prefix} len('time') must be equal to len('duration')")
+def F_entry_key(entry, key_name):
+    """
+    value of the description key_name of an entry (used as key of the entry), None if there is no value
+    """
 
-            confidence_l = F_numeric_input(numeric_l=confidence_l, check_vector=True, prefix=prefix, field_name='confidence')
-            start_freq_l = F_numeric_input(numeric_l=start_freq_l, check_vector=True, prefix=prefix, field_name='start_freq')
-            end_freq_l = F_numeric_input(numeric_l=end_freq_l, check_vector=True, prefix=prefix, field_name='end_freq')
+    atom_l = entry.get(key_name)
+    if atom_l:
+        value = atom_l[0].get('value')
+        if isinstance(value, str) and value != '':
+            return value
+    return None
 
-            if confidence_l:
-                if time_l:
-                    if len(time_l) != len(confidence_l):
-                        raise Exception(f"{prefix} len('time') must be equal to len('confidence')")
 
-            if start_freq_l:
-                if time_l:
-                    if len(time_l) != len(start_freq_l):
-                        raise Exception(f"{prefix} len('time') must be equal to len('start_freq')")
+def F_missing_key_l(entry, key_l):
+    """
+    descriptions of key_l which are missing in an entry (no atom, or no 'value' in the first atom)
+    """
 
-            if end_freq_l:
-                if time_l:
-                    if len(time_l) != len(end_freq_l):
-                        raise Exception(f"{prefix} len('time') must be equal to len('end_freq')")
+    missing_key_l = []
+    for key in key_l:
+        atom_l = entry.get(key)
+        if not atom_l or 'value' not in atom_l[0]:
+            missing_key_l.append(key)
+    return missing_key_l
 
 
-            if current_type_extent == 'breakpoint_value':
+def F_is_empty_value(atom_l):
+    """
+    True if the list of atoms is the empty 'value' created by C_pyjama.M_check for a missing description
+    """
 
-                # --- Look for the name of the corresponding breakpoint_time
-                # -- in descriptiondefinition
-                time_name = ''
-                for key in self.data['collection']['descriptiondefinition'].keys():
-                    if self.data['collection']['descriptiondefinition'][key]['type_extent'] == 'breakpoint_time':
-                        time_name = key
-
-                if len(time_name) == 0:
-                    raise Exception(f"{prefix} no 'breakpoint_time' has been defined in 'descriptiondefinition'")
-
-                if time_name not in self.data['collection']['entry'][self.current_position].keys():
-                    raise Exception(f"{prefix} no 'breakpoint_time' has been given for current entry")
-
-                if len(self.data['collection']['entry'][self.current_position][time_name]) == 0:
-                    raise Exception(f"{prefix} no 'breakpoint_time' has been given in current entry")
-
-                time_v = self.data['collection']['entry'][self.current_position][time_name][0]['value']  # --- 2024/10/19
-                nb_time = len(time_v[0])  # --- 2024/10/19
-                if len(value_l[0]) != nb_time: # --- 2024/10/19
-                    raise Exception(f"{prefix} number of rows of 'value' {len(value_l[0])} must be equal to number of 'time' {nb_time}")
-
-
-            entry = {}
-
-            if is_valid:
-                if value_l:
-                    value_l = F_backward_compatibility(value_l)
-                    entry['value'] = value_l
-                if time_l:
-                    time_l = F_backward_compatibility(time_l)
-                    entry['time'] = time_l
-                if duration_l:
-                    duration_l = F_backward_compatibility(duration_l)
-                    entry['duration'] = duration_l
-                if confidence_l:
-                    confidence_l = F_backward_compatibility(confidence_l)
-                    entry['confidence'] = confidence_l
-                if start_freq_l:
-                    start_freq_l = F_backward_compatibility(start_freq_l)
-                    entry['start_freq'] = start_freq_l
-                if end_freq_l:
-                    end_freq_l = F_backward_compatibility(end_freq_l)
-                    entry['end_freq'] = end_freq_l
-                if comment:
-                    entry['comment'] = comment
-
-                self.data['collection']['entry'][self.current_position][description_name].append(entry)
+    if len(atom_l) != 1 or len(atom_l[0]) != 1:
+        return False
+    value = atom_l[0].get('value')
+    return isinstance(value, str) and value == ''
 
-            else:
 
-                if self.not_valid_action == 'filter_out':
-                    print(f"{prefix} 'value'({value}) is not part of dictionary -> filtering-out")
-                else:
-                    raise Exception(f"{prefix} 'value'({value}) is not part of the dictionary -> add it first in 'descriptiondefinition'")
-                # --- END: Check validity of the entry
 
+class C_pyjama_shard_writer(C_pyjama_writer):
+    """
+    Writer of a shard of a sharded collection (see C_pyjama.M_save_sharded)
+        the shard has no header (the definitions are stored in the manifest) and contains one compact json entry per line,
+        M_write_entry returns the (byte offset, byte length) of the line of the entry
+    """
+
+    # ===============================================
+    def __init__(self, fileName, descriptiondefinition, sidecar=False):
+        """
+        """
+
+        super().__init__(fileName, descriptiondefinition, compact=True, sidecar=sidecar)
+        self.offset = 0
 
 
     # ===============================================
-    def M_check(self):
+    def M_header(self):
         """
-        Parse an existing pyjama structure
-            Check for ALL entries
-                That ALL descriptiondefinition exist
-                If not, creates an empty 'value' for this descriptiondefinition
         """
 
-        key_l = self.data['collection']['descriptiondefinition'].keys()
+        return ''
 
-        nb_entry = len(self.data['collection']['entry'])
-        for num_entry in range(0, nb_entry):
-            for key in key_l:
-                if key not in self.data['collection']['entry'][num_entry].keys():
-                    self.data['collection']['entry'][num_entry][key] = []
-                    self.data['collection']['entry'][num_entry][key].append({'value': ''})
-                elif len(self.data['collection']['entry'][num_entry][key]) == 0:
-                    self.data['collection']['entry'][num_entry][key] = []
-                    self.data['collection']['entry'][num_entry][key].append({'value': ''})
-                elif 'value' not in self.data['collection']['entry'][num_entry][key][0].keys():
-                    self.data['collection']['entry'][num_entry][key] = []
-                    self.data['collection']['entry'][num_entry][key].append({'value': ''})
 
-        return
+    # ===============================================
+    def M_write_entry(self, entry):
+        """
+        """
+
+        if self.sidecar_fid is not None:
+            entry = self.M_write_sidecar(entry)
+        text = (json.dumps(entry, **self.json_param_d) + '\n').encode('utf-8')
+        self.fid.write(text)
+        offset = self.offset
+        self.offset += len(text)
+        self.nb_entry += 1
+        return offset, len(text)
+
 
     # ===============================================
-    def M_print(self):
+    def M_close(self):
         """
         """
 
-        pp.pprint(self.data)
+        if self.fid.closed:
+            return
+        self.fid.close()
+        if self.sidecar_fid is not None:
+            self.sidecar_fid.close()
+            os.replace(self.sidecar_fileName + '.tmp', self.sidecar_fileName)
+
+
+
+class C_pyjama_shard_store():
+    """
+    Random access to the entries of a sharded collection (written by C_pyjama.M_save_sharded)
+        dirName/manifest.json: 'schemaversion', 'descriptiondefinition', list of the shard files, index file and name of the key description
+        dirName/shard_ggggg_xxxxx.jsonl: the entries (one compact json entry per line)
+        dirName/index_ggggg.npz: for each entry its shard, byte offset and byte length, and its key (the 'filepath' value)
+    (ggggg is the generation of the save, see C_pyjama.M_save_sharded)
+    Only the manifest and the index are read when the store is opened, each entry is then read with a single positioned read
+
+    with C_pyjama_shard_store(dirName) as store:
+        entry = store.M_get_entry(523112)
+        entry = store.M_get_entry_by_filepath('./_examples/audio1.mp3')
+
+    The breakpoint values stored in sidecar files are returned as np.memmap views (see C_pyjama_reader)
+    """
+
+    # ---- the sidecar references are resolved as in C_pyjama_reader
+    M_resolve_sidecar = C_pyjama_reader.M_resolve_sidecar
+    M_read_array = C_pyjama_reader.M_read_array
 
     # ===============================================
-    def M_save(self, fileName):
+    def __init__(self, dirName):
         """
         """
 
-        print("writting pyjama file: %s" % (fileName))
-        with open(fileName, 'w') as f:
-            #json.dump(self.data, f, encoding='utf-8', indent=4)
-            json.dump(self.data, f, indent=4)
+        self.dirName = dirName
+        self.fileName = os.path.join(dirName, SHARD_MANIFEST_NAME)
+        with open(self.fileName, 'r') as fid:
+            manifest = json.load(fid)
+        self.schemaversion = manifest['schemaversion']
+        self.descriptiondefinition = manifest['descriptiondefinition']
+        self.shard_fileName_l = manifest['shard']
+        self.key_name = manifest['key_name']
+
+        with np.load(os.path.join(dirName, manifest.get('index', SHARD_INDEX_NAME))) as index:
+            self.num_shard_v = index['shard']
+            self.offset_v = index['offset']
+            self.length_v = index['length']
+            key_l = index['key'].tolist()
+        self.key_d = {}
+        for num_entry, key in enumerate(key_l):
+            if key and key not in self.key_d:
+                self.key_d[key] = num_entry
+
+        self.sidecar_name_l = [description_name for description_name, definition in self.descriptiondefinition.items()
+                               if definition.get('type_extent') in SIDECAR_EXTENT_L]
+        self.fid_l = [None] * len(self.shard_fileName_l)
+        self.memmap_d = {}
+
+
+    # ===============================================
+    def __enter__(self):
+        return self
+
+
+    # ===============================================
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.M_close()
+
+
+    # ===============================================
+    def __len__(self):
+        return len(self.offset_v)
+
+
+    # ===============================================
+    def __iter__(self):
+        """
+        yield the entries in order (the shards are read sequentially)
+        """
+
+        for shard_fileName in self.shard_fileName_l:
+            with open(os.path.join(self.dirName, shard_fileName), 'rb') as fid:
+                for line in fid:
+                    entry = json.loads(line)
+                    if self.sidecar_name_l:
+                        self.M_resolve_sidecar(entry, self.sidecar_name_l)
+                    yield entry
+
+
+    # ===============================================
+    def M_close(self):
+        """
+        """
+
+        for fid in self.fid_l:
+            if fid is not None:
+                fid.close()
+        self.fid_l = [None] * len(self.shard_fileName_l)
+        self.memmap_d = {}
+
+
+    # ===============================================
+    def M_read(self, num_shard, offset, length):
+        """
+        read length bytes at offset in a shard
+            os.pread does not move the file position: the store can be shared by threads (and forked processes)
+        """
+
+        fid = self.fid_l[num_shard]
+        if fid is None:
+            fid = open(os.path.join(self.dirName, self.shard_fileName_l[num_shard]), 'rb')
+            self.fid_l[num_shard] = fid
+        if hasattr(os, 'pread'):
+            return os.pread(fid.fileno(), length, offset)
+        fid.seek(offset)
+        return fid.read(length)
+
+
+    # ===============================================
+    def M_get_entry(self, num_entry):
+        """
+        return the entry num_entry (negative values count from the end)
+        """
+
+        nb_entry = len(self.offset_v)
+        if num_entry < 0:
+            num_entry += nb_entry
+        if not 0 <= num_entry < nb_entry:
+            raise Exception(f"ERROR reading {self.dirName}: entry {num_entry} does not exist ({nb_entry} entries)")
+        entry = json.loads(self.M_read(int(self.num_shard_v[num_entry]), int(self.offset_v[num_entry]), int(self.length_v[num_entry])))
+        if self.sidecar_name_l:
+            self.M_resolve_sidecar(entry, self.sidecar_name_l)
+        return entry
+
+
+    # ===============================================
+    def M_get_entry_by_filepath(self, filepath):
+        """
+        return the entry with this 'filepath' value (key_name of M_save_sharded), None if there is no such entry
+        """
+
+        num_entry = self.key_d.get(filepath)
+        if num_entry is None:
+            return None
+        return self.M_get_entry(num_entry)
+
+
+
+class C_filepath_checker():
+    """
+    Check of the 'filepath' constraint with a cache of the results of os.path.isfile
+        only the existing files are cached: a missing file is checked again at each call (it may have been created since)
+        ttl: time (in seconds) after which a cached result is checked again (None: never)
+        M_invalidate() increments the generation: all the cached results are then checked again
+        the paths which are not cached are checked in bulk on a pool of threads (useful for network file systems)
+    """
+
+    # ===============================================
+    def __init__(self, ttl=None, nb_worker=16):
+        """
+        """
+
+        self.ttl = ttl
+        self.nb_worker = nb_worker
+        self.generation = 0
+        self.cache_d = {}
+
+
+    # ===============================================
+    def M_invalidate(self, path=None):
+        """
+        invalidate the cached result of path (or of all paths)
+        """
+
+        if path is None:
+            self.generation += 1
+        else:
+            self.cache_d.pop(path, None)
+
+
+    # ===============================================
+    def M_get_cached(self, path, now):
+        """
+        return the cached result of path (None if it is not cached or expired)
+        """
+
+        cached = self.cache_d.get(path)
+        if cached is None:
+            return None
+        is_file, check_time, generation = cached
+        if generation != self.generation or (self.ttl is not None and now - check_time > self.ttl):
+            return None
+        return is_file
+
+
+    # ===============================================
+    def M_is_file_d(self, path_l):
+        """
+        return the dictionary path -> os.path.isfile(path) for the paths of path_l
+        """
+
+        now = time.monotonic()
+        is_file_d = {}
+        check_l = []
+        for path in dict.fromkeys(path_l):
+            is_file = self.M_get_cached(path, now)
+            if is_file is None:
+                check_l.append(path)
+            else:
+                is_file_d[path] = is_file
+
+        if len(check_l) > 1 and self.nb_worker > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.nb_worker) as executor:
+                result_l = list(executor.map(os.path.isfile, check_l))
+        else:
+            result_l = [os.path.isfile(path) for path in check_l]
+
+        for path, is_file in zip(check_l, result_l):
+            if is_file:
+                self.cache_d[path] = (is_file, now, self.generation)
+            is_file_d[path] = is_file
+        return is_file_d
+
+
+
+class C_description():
+    """
+    Compiled version of a description definition (used by C_pyjama.M_update_entry)
+        the fields of the definition are read once (when the definition is added) instead of at each update
+        and the checks to be performed are decided once according to 'type_extent', 'type_content' and 'type_constraint'
+    The module functions used by the checks are called through the description,
+    so that C_pyjama.M_start_instrumentation can replace them by their counted version for its own descriptions only
+    """
+
+    F_check_value_in_dictionary = staticmethod(F_check_value_in_dictionary)
+    F_numeric_input = staticmethod(F_numeric_input)
+    F_numeric_list = staticmethod(F_numeric_list)
+
+    # ===============================================
+    def __init__(self, description_name, definition, sidecar=False):
+        """
+        """
+
+        self.description_name = description_name
+        self.definition = definition
+        self.type_extent = definition['type_extent']
+        self.type_content = definition['type_content']
+        self.type_constraint = definition['type_constraint']
+        self.nb_row_name = len(definition.get('row_name', []))
+        self.has_time = self.type_extent in ['marker', 'segment', 'breakpoint']
+        self.has_duration = self.type_extent == 'segment'
+        self.has_row_name = self.type_extent in ['breakpoint', 'breakpoint_value']
+        self.keep_array = sidecar and self.type_extent in SIDECAR_EXTENT_L
+        self.dictionary = None
+        self.dictionary_set = None
+
+
+    # ===============================================
+    def M_value(self, value_l, F_prefix):
+        """
+        check VALUE and transform it to a list (or to a np.ndarray for sidecar storage)
+        """
+
+        if type(value_l) not in [str, int, float, list, np.ndarray]:
+            raise Exception(f"{F_prefix()} 'value' must be str, int, float, list or np.ndarray")
+
+        if type(value_l) in [str, float, int]:
+            value_l = [value_l]
+
+        elif type(value_l) is np.ndarray:
+            if value_l.ndim != 2:
+                raise Exception(f"{F_prefix()} IF 'value' is np.ndarray THEN it must be have value.ndim == 2")
+            # --- value (nb_dim, nb_time) -> [ [allDim(Time1)] [allDim(Time2)] [allDim(Time3)] [allDim(Time4)] ]
+            #value_l = value_l.T.tolist() # --- 2024/10/19
+            if self.keep_array:
+                value_l = np.ascontiguousarray(value_l)
+            else:
+                value_l = value_l.tolist() # --- 2024/10/19
+
+        if self.has_row_name:
+            if len(value_l) != self.nb_row_name: # --- 2024/10/19
+                raise Exception(f"{F_prefix()} nb_dim of 'value' ({len(value_l[0])}) must be equal to nb_row_name' ({self.nb_row_name})")
+
+        return value_l
+
+
+    # ===============================================
+    def M_dictionary_set(self):
+        """
+        return the set index of the dictionary (re-built if the dictionary has been changed outside of F_check_value_in_dictionary)
+        """
+
+        dictionary = self.definition['dictionary']
+        if self.dictionary is not dictionary or len(self.dictionary_set) != len(dictionary):
+            self.dictionary = dictionary
+            self.dictionary_set = set(dictionary)
+        return self.dictionary_set
+
+
+    # ===============================================
+    def M_is_valid(self, value_l, not_valid_action, filepath_checker=None):
+        """
+        check the 'type_constraint' of VALUE
+        """
+
+        if self.type_constraint == 'free':
+            return True
+
+        elif self.type_constraint == 'filepath':
+            if filepath_checker is not None:
+                return all(filepath_checker.M_is_file_d(value_l).values())
+            for value in value_l:
+                if not(os.path.isfile(value)):
+                    return False
+            return True
+
+        elif self.type_constraint == 'value_in_dictionary':
+            if self.type_content == 'text':
+                dictionary_set = self.M_dictionary_set()
+            else:
+                dictionary_set = None
+            is_valid, dictionary = self.F_check_value_in_dictionary(value_l, self.type_content, self.definition['dictionary'], not_valid_action, dictionary_set)
+            return is_valid
+
+
+    # ===============================================
+    def M_is_valid_v(self, value_l, not_valid_action, filepath_checker=None):
+        """
+        vectorized check of the 'type_constraint' of a list of values (one per atom)
+        return the boolean mask of the valid values
+        """
+
+        nb_value = len(value_l)
+        if self.type_constraint == 'free':
+            return np.ones(nb_value, dtype=bool)
+
+        elif self.type_constraint == 'filepath':
+            if filepath_checker is None:
+                filepath_checker = C_filepath_checker()
+            is_file_d = filepath_checker.M_is_file_d(value_l)
+            return np.fromiter((is_file_d[value] for value in value_l), dtype=bool, count=nb_value)
+
+        elif self.type_constraint == 'value_in_dictionary':
+            dictionary = self.definition['dictionary']
+            if self.type_content == 'numeric':
+                value_v = np.asarray(value_l, dtype=float)
+                self.F_check_value_in_dictionary(value_v, self.type_content, dictionary, not_valid_action)
+                if len(dictionary) < 2:
+                    return np.zeros(nb_value, dtype=bool)
+                return (dictionary[0] <= value_v) & (value_v <= dictionary[1])
+            else:
+                dictionary_set = self.M_dictionary_set()
+                unique_l = list(dict.fromkeys(value_l))
+                self.F_check_value_in_dictionary(unique_l, self.type_content, dictionary, not_valid_action, dictionary_set)
+                return np.fromiter((value in dictionary_set for value in value_l), dtype=bool, count=nb_value)
+
+
+    # ===============================================
+    def M_check(self, value_l, confidence_l, time_l, duration_l, start_freq_l, end_freq_l, time_entry_l, F_prefix):
+        """
+        full check of the fields of an atom
+            time_entry_l: for 'breakpoint_value', the list of atoms of the corresponding 'breakpoint_time' in the current entry
+        """
+
+        value_l = self.M_value(value_l, F_prefix)
+
+        if self.has_time:
+            """ check TIME """
+
+            time_l = self.F_numeric_input(numeric_l=time_l, check_vector=True, prefix=F_prefix, field_name='time', keep_array=self.keep_array)
+            if len(time_l) > 1: # WASABI exception
+                #if len(time_l) != len(value_l): # --- 2024/10/19
+#                    raise Exception(f"{prefix} len('time'): {len(time_l)} must be equal to len('value'): {len(value_l)}")
+                if len(time_l) != len(value_l[0]):
+                    raise Exception(f"{F_prefix()} len('time'): {len(time_l)} must be equal to len('value'): {len(value_l[0])}")
+
+        if self.has_duration:
+            """ check DURATION """
+
+            duration_l = self.F_numeric_input(numeric_l=duration_l, check_vector=True, prefix=F_prefix, field_name='duration')
+
+            if len(time_l) > 1: # WASABI exception
+                if len(time_l) != len(duration_l):
+                    raise Exception(f"{F_prefix()} len('time') must be equal to len('duration')")
+
+        confidence_l = self.F_numeric_input(numeric_l=confidence_l, check_vector=True, prefix=F_prefix, field_name='confidence')
+        start_freq_l = self.F_numeric_input(numeric_l=start_freq_l, check_vector=True, prefix=F_prefix, field_name='start_freq')
+        end_freq_l = self.F_numeric_input(numeric_l=end_freq_l, check_vector=True, prefix=F_prefix, field_name='end_freq')
+
+        if confidence_l:
+            if F_has_value(time_l):
+                if len(time_l) != len(confidence_l):
+                    raise Exception(f"{F_prefix()} len('time') must be equal to len('confidence')")
+
+        if start_freq_l:
+            if F_has_value(time_l):
+                if len(time_l) != len(start_freq_l):
+                    raise Exception(f"{F_prefix()} len('time') must be equal to len('start_freq')")
+
+        if end_freq_l:
+            if F_has_value(time_l):
+                if len(time_l) != len(end_freq_l):
+                    raise Exception(f"{F_prefix()} len('time') must be equal to len('end_freq')")
+
+        if self.type_extent == 'breakpoint_value':
+
+            if time_entry_l is None:
+                raise Exception(f"{F_prefix()} no 'breakpoint_time' has been given for current entry")
+
+            if len(time_entry_l) == 0:
+                raise Exception(f"{F_prefix()} no 'breakpoint_time' has been given in current entry")
+
+            time_v = time_entry_l[0]['value']  # --- 2024/10/19
+            nb_time = len(time_v[0])  # --- 2024/10/19
+            if len(value_l[0]) != nb_time: # --- 2024/10/19
+                raise Exception(f"{F_prefix()} number of rows of 'value' {len(value_l[0])} must be equal to number of 'time' {nb_time}")
+
+        return value_l, confidence_l, time_l, duration_l, start_freq_l, end_freq_l
+
+
+    # ===============================================
+    def M_convert(self, value_l, confidence_l, time_l, duration_l, start_freq_l, end_freq_l):
+        """
+        trusted conversion of the fields of an atom (no check)
+        """
+
+        if type(value_l) in [str, float, int]:
+            value_l = [value_l]
+        elif type(value_l) is np.ndarray:
+            if self.keep_array:
+                value_l = np.ascontiguousarray(value_l)
+            else:
+                value_l = value_l.tolist()
+
+        if self.keep_array and isinstance(time_l, np.ndarray):
+            time_l = np.ascontiguousarray(time_l.ravel())
+        else:
+            time_l = self.F_numeric_list(time_l)
+
+        return value_l, self.F_numeric_list(confidence_l), time_l, self.F_numeric_list(duration_l), self.F_numeric_list(start_freq_l), self.F_numeric_list(end_freq_l)
+
+
+    # ===============================================
+    def M_atom(self, value_l, confidence_l, time_l, duration_l, start_freq_l, end_freq_l, comment):
+        """
+        create the atom (dictionary) from the checked fields
+        """
+
+        atom = {}
+        if self.keep_array:
+            if F_has_value(value_l):
+                atom['value'] = F_backward_compatibility(value_l)
+            if F_has_value(time_l):
+                atom['time'] = F_backward_compatibility(time_l)
+        else:
+            if value_l:
+                atom['value'] = F_backward_compatibility(value_l)
+            if time_l:
+                atom['time'] = F_backward_compatibility(time_l)
+        if duration_l:
+            atom['duration'] = F_backward_compatibility(duration_l)
+        if confidence_l:
+            atom['confidence'] = F_backward_compatibility(confidence_l)
+        if start_freq_l:
+            atom['start_freq'] = F_backward_compatibility(start_freq_l)
+        if end_freq_l:
+            atom['end_freq'] = F_backward_compatibility(end_freq_l)
+        if comment:
+            atom['comment'] = comment
+        return atom
+
+
+
+def F_flatten_value(value):
+    """
+    return the list of the (scalar) values of the 'value' of an atom (which can be a scalar, a list or a list of list)
+    """
+
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [item for sub_value in value for item in F_flatten_value(sub_value)]
+    return [value]
+
+
+def F_value_depth(value):
+    """
+    nesting depth of the 'value' of an atom: 0 for a scalar, 1 for a list, 2 for a list of list...
+    """
+
+    depth = 0
+    while isinstance(value, (list, tuple, np.ndarray)) and len(value):
+        depth += 1
+        value = value[0]
+    return depth
+
+
+def F_nest_value(item_l, depth):
+    """
+    'value' of an atom from its (scalar) values and its nesting depth (reverse of F_flatten_value and F_value_depth)
+    """
+
+    if depth == 0 and len(item_l) == 1:
+        return item_l[0]
+    value = item_l
+    for num_depth in range(depth - 1):
+        value = [value]
+    return value
+
+
+
+class C_value_index():
+    """
+    Inverted index of the values of a description (used by C_pyjama.M_select)
+        'text': hash postings value -> entry indices
+        'numeric': values sorted (with their entry indices) for range queries with searchsorted
+    New atoms are added incrementally (the numeric values are merged in the sorted arrays at the next query),
+    removed atoms (C_pyjama.M_delete_atom, M_replace_atom) are removed from the postings and sorted arrays
+    """
+
+    # ===============================================
+    def __init__(self, description):
+        """
+        """
+
+        self.is_numeric = description.type_content == 'numeric'
+        self.posting_d = {}
+        self.value_v = np.zeros(0)
+        self.entry_v = np.zeros(0, dtype=int)
+        self.pending_value_l = []
+        self.pending_entry_l = []
+
+
+    # ===============================================
+    def M_add(self, num_entry, atom_l):
+        """
+        add the values of the atoms of an entry
+        """
+
+        for atom in atom_l:
+            if 'value' not in atom:
+                continue
+            for value in F_flatten_value(atom['value']):
+                if self.is_numeric:
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        self.pending_value_l.append(value)
+                        self.pending_entry_l.append(num_entry)
+                else:
+                    try:
+                        self.posting_d.setdefault(value, set()).add(num_entry)
+                    except TypeError:
+                        # --- not hashable
+                        pass
+
+
+    # ===============================================
+    def M_remove(self, num_entry, atom_l, entry_atom_l):
+        """
+        remove the values of the atoms atom_l of an entry
+            entry_atom_l: atoms remaining in the entry ('text' values still used by one of them are kept)
+        """
+
+        value_l = [value for atom in atom_l if 'value' in atom for value in F_flatten_value(atom['value'])]
+        if self.is_numeric:
+            value_l = [value for value in value_l if isinstance(value, (int, float)) and not isinstance(value, bool)]
+            if not value_l:
+                return
+            value_v, entry_v = self.M_sorted()
+            position_l = []
+            for value in value_l:
+                start = np.searchsorted(value_v, value, side='left')
+                stop = np.searchsorted(value_v, value, side='right')
+                for position in (start + np.flatnonzero(entry_v[start:stop] == num_entry)).tolist():
+                    if position not in position_l:
+                        position_l.append(position)
+                        break
+            self.value_v = np.delete(value_v, position_l)
+            self.entry_v = np.delete(entry_v, position_l)
+            return
+
+        remaining_s = set()
+        for atom in entry_atom_l:
+            if 'value' in atom:
+                for value in F_flatten_value(atom['value']):
+                    try:
+                        remaining_s.add(value)
+                    except TypeError:
+                        pass
+        for value in value_l:
+            try:
+                if value not in remaining_s and value in self.posting_d:
+                    self.posting_d[value].discard(num_entry)
+                    if not self.posting_d[value]:
+                        del self.posting_d[value]
+            except TypeError:
+                pass
+
+
+    # ===============================================
+    def M_sorted(self):
+        """
+        merge the pending numeric values in the sorted arrays
+        """
+
+        if self.pending_value_l:
+            pending_value_v = np.asarray(self.pending_value_l, dtype=float)
+            pending_entry_v = np.asarray(self.pending_entry_l, dtype=int)
+            order_v = np.argsort(pending_value_v, kind='stable')
+            pending_value_v = pending_value_v[order_v]
+            pending_entry_v = pending_entry_v[order_v]
+            position_v = np.searchsorted(self.value_v, pending_value_v, side='right')
+            self.value_v = np.insert(self.value_v, position_v, pending_value_v)
+            self.entry_v = np.insert(self.entry_v, position_v, pending_entry_v)
+            self.pending_value_l = []
+            self.pending_entry_l = []
+        return self.value_v, self.entry_v
+
+
+    # ===============================================
+    def M_select(self, criterion):
+        """
+        return the set of entry indices matching criterion
+            'numeric': (min_value, max_value) range (bounds included) or a single value
+            'text': a single value or a list/set/tuple of values (any of them)
+        """
+
+        if self.is_numeric:
+            if isinstance(criterion, (tuple, list)):
+                min_value, max_value = criterion
+            else:
+                min_value = max_value = criterion
+            value_v, entry_v = self.M_sorted()
+            start = np.searchsorted(value_v, min_value, side='left')
+            stop = np.searchsorted(value_v, max_value, side='right')
+            return set(entry_v[start:stop].tolist())
+
+        if isinstance(criterion, (tuple, list, set, frozenset)):
+            entry_s = set()
+            for value in criterion:
+                entry_s.update(self.posting_d.get(value, ()))
+            return entry_s
+        return set(self.posting_d.get(criterion, ()))
+
+
+
+class C_time_index():
+    """
+    Temporal index of the atoms of a 'marker' or 'segment' description (used by C_pyjama.M_find_time)
+        the items (atoms, or elements of atoms storing lists of time) are sorted by start time,
+        queries use searchsorted on the start times (bounded by the maximum duration)
+    """
+
+    # ===============================================
+    def __init__(self, entry_l, description_name):
+        """
+        entry_l: list of (num_entry, entry) to be indexed
+        """
+
+        item_l = []
+        for num_entry, entry in entry_l:
+            for num_atom, atom in enumerate(entry.get(description_name, [])):
+                if 'time' not in atom:
+                    continue
+                time_l = atom['time']
+                duration_l = atom.get('duration', 0.)
+                if not isinstance(time_l, list):
+                    item_l.append((time_l, duration_l, num_entry, num_atom, -1))
+                    continue
+                for num_item, time in enumerate(time_l):
+                    duration = duration_l[num_item] if isinstance(duration_l, list) else duration_l
+                    item_l.append((time, duration, num_entry, num_atom, num_item))
+
+        if item_l:
+            time_v, duration_v, num_entry_v, num_atom_v, num_item_v = (np.asarray(column) for column in zip(*item_l))
+        else:
+            time_v, duration_v = np.zeros(0), np.zeros(0)
+            num_entry_v, num_atom_v, num_item_v = np.zeros(0, dtype=int), np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+
+        order_v = np.argsort(np.asarray(time_v, dtype=float), kind='stable')
+        self.start_v = np.asarray(time_v, dtype=float)[order_v]
+        self.end_v = self.start_v + np.asarray(duration_v, dtype=float)[order_v]
+        self.num_entry_v = num_entry_v[order_v]
+        self.num_atom_v = num_atom_v[order_v]
+        self.num_item_v = num_item_v[order_v]
+        self.max_duration = float(np.max(self.end_v - self.start_v)) if len(order_v) else 0.
+
+
+    # ===============================================
+    def M_query(self, time_start, time_end=None, mode='overlap'):
+        """
+        return the positions (in time order) of the items
+            time_end is None: items active at time_start (start <= time_start < end), markers at time_start
+            mode='overlap': items overlapping [time_start, time_end] (markers inside [time_start, time_end])
+            mode='within': items inside [time_start, time_end]
+        """
+
+        if time_end is None:
+            time_end = time_start
+            is_point = True
+        else:
+            is_point = False
+
+        if mode == 'within':
+            start = np.searchsorted(self.start_v, time_start, side='left')
+            stop = np.searchsorted(self.start_v, time_end, side='right')
+            return start + np.flatnonzero(self.end_v[start:stop] <= time_end)
+
+        elif mode == 'overlap':
+            start = np.searchsorted(self.start_v, time_start - self.max_duration, side='left')
+            stop = np.searchsorted(self.start_v, time_end, side='right')
+            start_v = self.start_v[start:stop]
+            end_v = self.end_v[start:stop]
+            is_marker_v = end_v == start_v
+            if is_point:
+                is_found_v = np.where(is_marker_v, start_v == time_start, end_v > time_start)
+            else:
+                is_found_v = np.where(is_marker_v, start_v >= time_start, end_v > time_start)
+            return start + np.flatnonzero(is_found_v)
+
+        else:
+            raise Exception(f"unknown mode '{mode}' (must be 'overlap' or 'within')")
+
+
+
+def F_build_pyramid(value_m, factor=4):
+    """
+    Multi-resolution summary of a breakpoint 'value' (nb_dim, nb_time)
+        level k (k=0, 1, ...) summarizes blocks of factor**(k+1) consecutive times by their 'min', 'max' and 'mean' (nb_dim, nb_block),
+        the levels are computed until a single block remains
+    return {'factor': factor, 'level': [{'min': ..., 'max': ..., 'mean': ...}, ...]}
+    """
+
+    value_m = np.asarray(value_m, dtype=float)
+    if value_m.ndim == 1:
+        value_m = value_m[np.newaxis, :]
+    level_l = []
+    min_m = max_m = sum_m = value_m
+    count_v = np.ones(value_m.shape[1])
+    while count_v.shape[0] > 1:
+        start_v = np.arange(0, count_v.shape[0], factor)
+        min_m = np.minimum.reduceat(min_m, start_v, axis=1)
+        max_m = np.maximum.reduceat(max_m, start_v, axis=1)
+        sum_m = np.add.reduceat(sum_m, start_v, axis=1)
+        count_v = np.add.reduceat(count_v, start_v)
+        level_l.append({'min': min_m, 'max': max_m, 'mean': sum_m / count_v})
+    return {'factor': factor, 'level': level_l}
+
+
+def F_reduce_breakpoint(time_v, value_m, pyramid, time_start, time_end, nb_point=None):
+    """
+    Return the part [time_start, time_end] of a breakpoint 'value' (nb_dim, nb_time) with at least nb_point points
+        the times are selected with searchsorted on time_v,
+        the coarsest level of the pyramid (see F_build_pyramid) with at least nb_point blocks in [time_start, time_end] is used
+        (the first and last blocks may start before time_start or end after time_end),
+        without pyramid the selected times are reduced into nb_point blocks
+    return {'time': (nb_point), 'min': (nb_dim, nb_point), 'max': ..., 'mean': ...}
+        (at full resolution 'min', 'max' and 'mean' are the selected 'value')
+    """
+
+    time_v = np.asarray(time_v, dtype=float).ravel()
+    value_m = np.asarray(value_m)
+    if value_m.ndim == 1:
+        value_m = value_m[np.newaxis, :]
+    start = int(np.searchsorted(time_v, time_start, side='left'))
+    stop = int(np.searchsorted(time_v, time_end, side='right'))
+    nb_time = stop - start
+
+    if nb_point is None or nb_time <= nb_point:
+        value_m = value_m[:, start:stop]
+        return {'time': time_v[start:stop], 'min': value_m, 'max': value_m, 'mean': value_m}
+
+    if pyramid is None:
+        start_v = start + (np.arange(nb_point) * nb_time) // nb_point
+        value_m = np.asarray(value_m[:, start:stop], dtype=float)
+        count_v = np.diff(np.append(start_v, stop))
+        return {'time': time_v[start_v],
+                'min': np.minimum.reduceat(value_m, start_v - start, axis=1),
+                'max': np.maximum.reduceat(value_m, start_v - start, axis=1),
+                'mean': np.add.reduceat(value_m, start_v - start, axis=1) / count_v}
+
+    factor = pyramid['factor']
+    num_level = -1
+    block_size = 1
+    for num in range(len(pyramid['level'])):
+        if nb_time // (block_size * factor) < nb_point:
+            break
+        block_size *= factor
+        num_level += 1
+    if num_level < 0:
+        value_m = value_m[:, start:stop]
+        return {'time': time_v[start:stop], 'min': value_m, 'max': value_m, 'mean': value_m}
+    level = pyramid['level'][num_level]
+    block_start = start // block_size
+    block_stop = (stop - 1) // block_size + 1
+    reduced_d = {'time': time_v[np.arange(block_start, block_stop) * block_size]}
+    for key in PYRAMID_KEY_L:
+        reduced_d[key] = np.asarray(level[key])[:, block_start:block_stop]
+    return reduced_d
+
+
+def F_read_columnar(fileName):
+    """
+    Read a columnar .npz file (see C_pyjama.M_save_columnar) without creating the entries
+    return the header (dictionary with 'schemaversion', 'descriptiondefinition', 'nb_entry')
+    and the columns (dictionary of description_name -> dictionary of np.ndarray, see C_pyjama.M_to_columnar)
+    """
+
+    with np.load(fileName, allow_pickle=False) as npz:
+        header = json.loads(str(npz['header']))
+        column_d = {description_name: {} for description_name in header['descriptiondefinition'].keys()}
+        for key in npz.files:
+            if key == 'header':
+                continue
+            description_name, column_name = key.rsplit('/', 1)
+            column_d[description_name][column_name] = npz[key]
+    for description_name, dictionary in header['dictionary'].items():
+        column_d[description_name]['dictionary'] = dictionary
+    return header, column_d
+
+
+def F_read_lab(fileName):
+    """
+    Read a .lab annotation file (one annotation per line, tab separated)
+        time label (markers, such as .beat.lab) or start_time stop_time label (segments, such as .struct.lab)
+    return time_v, stop_v (None if the file has no stop column), label_l (without quotes)
+    """
+
+    with open(fileName, 'r') as fid:
+        text = fid.read()
+    line_l = text.splitlines()
+    column_l = None
+    if '\t' in text and line_l:
+        # --- fast path: the columns are read from the split of the whole text
+        nb_column = line_l[0].count('\t') + 1
+        field_l = '\t'.join(line_l).split('\t')
+        if len(field_l) == nb_column * len(line_l):
+            column_l = [field_l[num_column::nb_column] for num_column in range(nb_column)]
+    if column_l is None:
+        separator = '\t' if '\t' in text else None
+        row_l = [line.split(separator) for line in line_l if line.strip()]
+        if not row_l:
+            return np.zeros(0), None, []
+        column_l = list(zip(*row_l))
+    try:
+        time_v = np.array(column_l[0], dtype=float)
+        stop_v = np.array(column_l[1], dtype=float) if len(column_l) > 2 else None
+    except ValueError:
+        raise Exception(f"ERROR reading {fileName}: the time columns must be numeric")
+    if len(column_l) > 1:
+        label_l = [label.strip().strip('\'"') for label in column_l[-1]]
+    else:
+        label_l = [''] * len(time_v)
+    return time_v, stop_v, label_l
+
+
+def F_read_lab_chunk(fileName_l):
+    """
+    read a list of .lab files (see F_read_lab_l)
+    """
+
+    return [F_read_lab(fileName) for fileName in fileName_l]
+
+
+def F_read_lab_l(fileName_l, nb_worker=None):
+    """
+    Read .lab files (see F_read_lab) over a pool of processes
+        nb_worker: number of processes (default: number of cores), 1 to read them in the current process
+    return the list of (time_v, stop_v, label_l) in the order of fileName_l
+    """
+
+    fileName_l = list(fileName_l)
+    if nb_worker is None:
+        nb_worker = os.cpu_count() or 1
+    if nb_worker <= 1 or len(fileName_l) < 2:
+        return F_read_lab_chunk(fileName_l)
+
+    nb_chunk = min(4 * nb_worker, len(fileName_l))
+    chunk_l = [fileName_l[len(fileName_l) * num_chunk // nb_chunk:len(fileName_l) * (num_chunk+1) // nb_chunk] for num_chunk in range(nb_chunk)]
+    lab_l = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=nb_worker) as executor:
+        for chunk_lab_l in executor.map(F_read_lab_chunk, chunk_l):
+            lab_l.extend(chunk_lab_l)
+    return lab_l
+
+
+def F_build_chunk(template, function, item_l):
+    """
+    build the partial collection of a list of items (see F_build_collection)
+    """
+
+    my_pyjama = template.M_copy_definition()
+    for item in item_l:
+        function(my_pyjama, item)
+    return my_pyjama
+
+
+def F_build_collection(template, function, item_l, nb_worker=None, nb_chunk=None):
+    """
+    Build a collection by distributing the items (for example audio files) over a pool of processes
+        template: C_pyjama which defines the options and the 'descriptiondefinition' of the collection
+        function(my_pyjama, item): add the entry (or entries) of item to my_pyjama
+            (it must be defined at the top-level of a module to be used by the processes)
+        nb_worker: number of processes (default: number of cores)
+        nb_chunk: number of partial collections (default: 4*nb_worker)
+    The partial collections are merged (M_merge) in the order of item_l
+    """
+
+    item_l = list(item_l)
+    if nb_worker is None:
+        nb_worker = os.cpu_count() or 1
+    if nb_chunk is None:
+        nb_chunk = 4 * nb_worker
+    nb_chunk = max(1, min(nb_chunk, len(item_l)))
+    chunk_l = [item_l[len(item_l) * num_chunk // nb_chunk:len(item_l) * (num_chunk+1) // nb_chunk] for num_chunk in range(nb_chunk)]
+
+    # --- the entries of template (if any) are not sent to the processes
+    template = template.M_copy_definition()
+    my_pyjama = template.M_copy_definition()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=nb_worker) as executor:
+        for partial in executor.map(F_build_chunk, [template] * nb_chunk, [function] * nb_chunk, chunk_l):
+            my_pyjama.M_merge(partial)
+    return my_pyjama
+
+
+INSTRUMENTED_METHOD_L = ['M_add_definition', 'M_add_entry', 'M_add_entries', 'M_update_entry', 'M_update_entries',
+                         'M_replace_atom', 'M_delete_atom', 'M_check', 'M_check_filepath', 'M_load', 'M_save', 'M_flush',
+                         'M_merge', 'M_select', 'M_find_time', 'M_to_columnar', 'M_from_columnar']
+INSTRUMENTED_FUNCTION_L = ['F_check_value_in_dictionary', 'F_numeric_input', 'F_numeric_list']
+
+
+
+class C_instrumentation():
+    """
+    Call counters and cumulative timings (see C_pyjama.M_start_instrumentation)
+        count_d: name -> number of calls
+        time_d: name -> cumulative time in seconds (including the time of the nested calls)
+        'validation' and 'storage': time spent by M_update_entry and M_update_entries checking the values and storing the atoms
+    """
+
+    # ===============================================
+    def __init__(self):
+        """
+        """
+
+        self.count_d = {}
+        self.time_d = {}
+
+
+    # ===============================================
+    def M_add(self, name, duration):
+        """
+        """
+
+        self.count_d[name] = self.count_d.get(name, 0) + 1
+        self.time_d[name] = self.time_d.get(name, 0.) + duration
+
+
+    # ===============================================
+    def M_wrap(self, name, function):
+        """
+        return function counted and timed under name
+        """
+
+        perf_counter = time.perf_counter
+
+        def F_wrapper(*arg_l, **arg_d):
+            time_start = perf_counter()
+            try:
+                return function(*arg_l, **arg_d)
+            finally:
+                self.M_add(name, perf_counter() - time_start)
+
+        F_wrapper.__wrapped__ = function
+        return F_wrapper
+
+
+    # ===============================================
+    def M_reset(self):
+        """
+        """
+
+        self.count_d = {}
+        self.time_d = {}
+
+
+    # ===============================================
+    def M_report(self):
+        """
+        return the report (text) of the calls, sorted by decreasing cumulative time
+        """
+
+        line_l = ['%-30s %10s %12s %14s' % ('name', 'nb_call', 'time (s)', 'per call (us)')]
+        for name in sorted(self.time_d, key=self.time_d.get, reverse=True):
+            count = self.count_d[name]
+            line_l.append('%-30s %10d %12.4f %14.2f' % (name, count, self.time_d[name], 1e6 * self.time_d[name] / count))
+        return '\n'.join(line_l)
+
+
+
+class C_pyjama():
+    """
+    """
+
+    data = None
+    current_position = -1
+    not_valid_action = '' # ---- decide how to deal with values which are not in dictionary
+    sidecar = False # ---- keep breakpoint values as np.ndarray and save them in a sidecar file
+    validate = 'full' # ---- 'full': check all updates, 'trusted': no check of the updates
+    description_d = None # ---- compiled descriptiondefinition (C_description)
+    extent_name_d = None # ---- names of the descriptions for each type_extent
+    index_d = None # ---- C_value_index of the descriptions (created by M_select)
+    time_index_d = None # ---- C_time_index of (num_entry, description_name), num_entry=None for the whole collection (created by M_find_time)
+    filepath_check = 'immediate' # ---- 'immediate': check 'filepath' at each update, 'deferred': check them in bulk in M_check_filepath
+    filepath_checker = None # ---- C_filepath_checker (cache of the checked files)
+    pending_filepath_l = None # ---- (num_entry, description_name, atom) of the 'filepath' not yet checked ('deferred')
+    journal_fileName = None # ---- journal of the operations (see M_open_journal)
+    journal_fid = None
+    is_journal_paused = False # ---- True while loading or replaying (the operations are not journaled)
+    key_index_d = None # ---- 'filepath' value -> index of the entry (created by M_get_num_entry, maintained on insert)
+    shard_store = None # ---- C_pyjama_shard_store of the sharded collection opened with M_open_sharded
+    fill = 'eager' # ---- 'eager': M_check adds the missing descriptions to the entries, 'lazy': they are added when writing or iterating (M_iter_entries)
+    checked_position = 0 # ---- entries before checked_position were complete at the last M_check
+    checked_name_s = None # ---- descriptions defined at the last M_check
+    dirty_entry_s = None # ---- entries (before checked_position) which atoms have been removed or replaced since the last M_check
+    instrumentation = None # ---- C_instrumentation (see M_start_instrumentation)
+    function_instrumentation = None # ---- C_instrumentation of the module functions called by the descriptions (see M_start_instrumentation)
+
+
+    # ===============================================
+    def __init__(self, not_valid_action='add_to_dictionary', sidecar=False, validate='full', filepath_check='immediate', filepath_ttl=None, fill='eager'):
+        """
+        sidecar: IF True THEN the breakpoint values are kept in memory as np.ndarray (instead of lists)
+            and M_save stores them in a binary sidecar file (see C_pyjama_writer)
+        validate: 'full' to check all values given to M_update_entry,
+            'trusted' to skip the checks (for bulk ingestion of values from producers which are known to be valid)
+        filepath_check: 'immediate' to check the 'filepath' constraint at each update,
+            'deferred' to check them in bulk (on a pool of threads) in M_check_filepath (called by M_check, M_flush and M_save)
+        filepath_ttl: time (in seconds) during which an existing file is cached by the 'filepath' check (None: no expiration),
+            a missing file is always checked again
+        fill: 'eager' to add the missing descriptions ({'value': ''}) to the entries in M_check,
+            'lazy' to add them only when the entries are written (M_save, M_flush, M_save_sharded) or iterated (M_iter_entries)
+        """
+
+        self.data = {'schemaversion': '1.41',
+                     'collection': {'descriptiondefinition': {}, 'entry': []}}
+        if not_valid_action in ['add_to_dictionary', 'filter_out', 'reject']:
+            self.not_valid_action = not_valid_action
+        else:
+            raise Exception(f'Problem creating "pyjama" structure: unknown type "{not_valid_action}" for not_valid_action')
+        if validate in ['full', 'trusted']:
+            self.validate = validate
+        else:
+            raise Exception(f'Problem creating "pyjama" structure: unknown type "{validate}" for validate')
+        if filepath_check in ['immediate', 'deferred']:
+            self.filepath_check = filepath_check
+        else:
+            raise Exception(f'Problem creating "pyjama" structure: unknown type "{filepath_check}" for filepath_check')
+        if fill in ['eager', 'lazy']:
+            self.fill = fill
+        else:
+            raise Exception(f'Problem creating "pyjama" structure: unknown type "{fill}" for fill')
+        self.filepath_checker = C_filepath_checker(ttl=filepath_ttl)
+        self.pending_filepath_l = []
+        self.checked_name_s = set()
+        self.dirty_entry_s = set()
+        self.sidecar = sidecar
+        self.description_d = {}
+        self.extent_name_d = {}
+        self.index_d = {}
+        self.time_index_d = {}
+
+
+    # ===============================================
+    def __setattr__(self, attr_name, attr_val):
+        """
+        """
+
+        if hasattr(self, attr_name):
+            self.__dict__[attr_name] = attr_val
+        else:
+            raise Exception(f"self.{attr_name} note part of the fields")
+
+
+    # ===============================================
+    def M_add_definition(self, 
+                        description_name, 
+                        type_constraint='free', 
+                        type_content='text',
+                        type_extent='global', 
+                        #column_name=[],  # --- 2024/10/19
+                        row_name=[], # --- 2024/10/19
+                        generator={},
+                        dictionary=[], 
+                        is_table=True, 
+                        is_editable=True,
+                        is_filter=True):
+        """
+        """
+
+        self.data['collection']['descriptiondefinition'][description_name] = collections.OrderedDict()
+
+        if type_content in ['text', 'numeric']:
+            self.data['collection']['descriptiondefinition'][description_name]['type_content'] = type_content
+        else:
+            raise Exception(f'unknown type "{type_content}" for type_content')
+
+        if type_extent in ['global', 'segment', 'marker', 'breakpoint', 'breakpoint_time', 'breakpoint_value']:
+            self.data['collection']['descriptiondefinition'][description_name]['type_extent'] = type_extent
+        else:
+            raise Exception(f'unknown type "{type_extent}" for type_extent')
+
+        if type_constraint in ['filepath', 'free', 'value_in_dictionary']:
+            self.data['collection']['descriptiondefinition'][description_name]['type_constraint'] = type_constraint
+        else:
+            raise Exception(f'unknown type "{type_constraint}" for type_constraint')
+
+        self.data['collection']['descriptiondefinition'][description_name]['dictionary'] = copy.copy(dictionary)
+        #self.data['collection']['descriptiondefinition'][description_name]['column_name'] = copy.copy(column_name) # --- 2024/10/19
+        self.data['collection']['descriptiondefinition'][description_name]['row_name'] = copy.copy(row_name) # --- 2024/10/19
+        self.data['collection']['descriptiondefinition'][description_name]['is_table'] = is_table
+        self.data['collection']['descriptiondefinition'][description_name]['is_editable'] = is_editable
+        self.data['collection']['descriptiondefinition'][description_name]['is_filter'] = is_filter
+        if len(generator):
+            self.data['collection']['descriptiondefinition'][description_name]['generator'] = generator
+
+        self.M_compile_definition(description_name)
+        self.M_journal({'op': 'add_definition', 'description_name': description_name, 'definition': self.data['collection']['descriptiondefinition'][description_name]})
+
+
+    # ===============================================
+    def M_compile_definition(self, description_name):
+        """
+        create the C_description of a description and update the names of the descriptions for each type_extent
+        """
+
+        definition = self.data['collection']['descriptiondefinition'][description_name]
+        self.description_d[description_name] = C_description(description_name, definition, self.sidecar)
+        if self.function_instrumentation is not None:
+            self.M_instrument_description(self.description_d[description_name])
+        for name_l in self.extent_name_d.values():
+            if description_name in name_l:
+                name_l.remove(description_name)
+        self.extent_name_d.setdefault(definition['type_extent'], []).append(description_name)
+
+
+    # ===============================================
+    def M_get_description(self, description_name):
+        """
+        return the C_description of a description (compile it if the definition has been added directly in self.data)
+        """
+
+        description = self.description_d.get(description_name)
+        if description is None or description.definition is not self.data['collection']['descriptiondefinition'].get(description_name):
+            if description_name not in self.data['collection']['descriptiondefinition']:
+                return None
+            self.M_compile_definition(description_name)
+            description = self.description_d[description_name]
+        return description
+
+
+    # ===============================================
+    def M_add_entry(self):
+        """
+        """
+
+        entry = {}
+        for description_name in self.data['collection']['descriptiondefinition'].keys():
+            entry[description_name] = []
+        self.data['collection']['entry'].append(entry)
+        self.current_position += 1
+        self.M_journal({'op': 'add_entry'})
+
+
+    # ===============================================
+    def M_add_entries(self, nb_entry):
+        """
+        Add nb_entry (empty) entries, the new entries are the last nb_entry of the collection
+        """
+
+        key_l = list(self.data['collection']['descriptiondefinition'].keys())
+        self.data['collection']['entry'].extend({description_name: [] for description_name in key_l} for num in range(nb_entry))
+        self.current_position += nb_entry
+        self.M_journal({'op': 'add_entries', 'nb_entry': nb_entry})
+
+
+    # ===============================================
+    def M_update_entries(self,
+                         description_name,
+                         value_l,
+                         time_l=None,
+                         duration_l=None,
+                         confidence_l=None,
+                         start_freq_l=None,
+                         end_freq_l=None,
+                         offset_v=None,
+                         entry_index_v=None,
+                         filepath_l=None,
+                         validate=None):
+        """
+        Add atoms to the description 'description_name' of many entries in one call (for 'global', 'marker' and 'segment')
+            value_l, time_l, duration_l, confidence_l, start_freq_l, end_freq_l: flat list or np.ndarray with one element per atom (nb_atom)
+            offset_v: (nb_entry+1) offsets of the atoms of each entry (CSR layout),
+                the atoms of the k-th entry are value_l[offset_v[k]:offset_v[k+1]]
+                default: one atom per entry
+            entry_index_v: (nb_entry) index of the entries to be updated
+                default: the last nb_entry entries of the collection (as added by M_add_entries)
+            filepath_l: (nb_entry) 'filepath' values of the entries to be updated (instead of entry_index_v, see M_get_num_entry)
+            validate: 'full' or 'trusted' (default: self.validate)
+
+        example: beat positions of 3 entries
+            my.M_add_entries(3)
+            my.M_update_entries('beat', value_l=label_l, time_l=time_v, offset_v=[0, 120, 250, 400])
+        """
+        F_prefix = lambda: f"ERROR updating self.data['collection']['entry'][...]['{description_name}']:\n\t"
+
+        description = self.M_get_description(description_name)
+        if description is None:
+            raise Exception(f"{F_prefix()} '{description_name}' is not part of 'descriptiondefinition' -> add it first in 'descriptiondefinition'")
+        if description.type_extent not in ['global', 'marker', 'segment']:
+            raise Exception(f"{F_prefix()} M_update_entries can only be used for 'global', 'marker' and 'segment' type_extent (use M_update_entry)")
+
+        if validate is None:
+            validate = self.validate
+        if self.instrumentation is not None:
+            time_start = time.perf_counter()
+
+        if isinstance(value_l, np.ndarray):
+            value_l = value_l.ravel().tolist()
+        nb_atom = len(value_l)
+
+        # --- numeric columns
+        column_d = {'time': time_l, 'duration': duration_l, 'confidence': confidence_l, 'start_freq': start_freq_l, 'end_freq': end_freq_l}
+        for key in list(column_d.keys()):
+            if column_d[key] is None:
+                del column_d[key]
+                continue
+            try:
+                column_v = np.asarray(column_d[key], dtype=float).ravel()
+            except (ValueError, TypeError):
+                raise Exception(f"{F_prefix()} '{key}' must be numeric")
+            if validate == 'full' and len(column_v) != nb_atom:
+                raise Exception(f"{F_prefix()} len('{key}'): {len(column_v)} must be equal to len('value'): {nb_atom}")
+            column_d[key] = column_v
+
+        if validate == 'full':
+            if description.type_extent in ['marker', 'segment'] and 'time' not in column_d:
+                raise Exception(f"{F_prefix()} 'time' must be given for '{description.type_extent}'")
+            if description.type_extent == 'segment' and 'duration' not in column_d:
+                raise Exception(f"{F_prefix()} 'duration' must be given for 'segment'")
+            if description.type_content == 'numeric':
+                try:
+                    np.asarray(value_l, dtype=float)
+                except (ValueError, TypeError):
+                    raise Exception(f"{F_prefix()} 'value' must be numeric")
+
+        # --- atoms -> entries
+        if offset_v is None:
+            offset_v = np.arange(nb_atom + 1)
+        else:
+            offset_v = np.asarray(offset_v, dtype=int)
+        nb_entry = len(offset_v) - 1
+        if filepath_l is not None:
+            entry_index_v = np.asarray([self.M_get_num_entry(filepath=filepath) for filepath in filepath_l], dtype=int)
+        elif entry_index_v is None:
+            entry_index_v = np.arange(len(self.data['collection']['entry']) - nb_entry, len(self.data['collection']['entry']))
+        else:
+            entry_index_v = np.asarray(entry_index_v, dtype=int)
+
+        if validate == 'full':
+            if nb_entry < 0 or offset_v[0] != 0 or offset_v[-1] != nb_atom or np.any(np.diff(offset_v) < 0):
+                raise Exception(f"{F_prefix()} 'offset_v' must be increasing from 0 to len('value'): {nb_atom}")
+            if len(entry_index_v) != nb_entry:
+                raise Exception(f"{F_prefix()} len('entry_index_v'): {len(entry_index_v)} must be equal to len('offset_v')-1: {nb_entry}")
+            if nb_entry and (entry_index_v.min() < 0 or entry_index_v.max() >= len(self.data['collection']['entry'])):
+                raise Exception(f"{F_prefix()} 'entry_index_v' must be in [0, {len(self.data['collection']['entry'])}[")
+
+        # --- type_constraint
+        is_deferred = description.type_constraint == 'filepath' and self.filepath_check == 'deferred'
+        if validate == 'full' and not is_deferred:
+            is_valid_v = description.M_is_valid_v(value_l, self.not_valid_action, self.filepath_checker)
+            if not np.all(is_valid_v):
+                not_valid_l = [value_l[num] for num in np.flatnonzero(~is_valid_v)[:10]]
+                if self.not_valid_action == 'filter_out':
+                    print(f"{F_prefix()} 'value'({not_valid_l}) is not part of dictionary -> filtering-out")
+                else:
+                    raise Exception(f"{F_prefix()} 'value'({not_valid_l}) is not part of the dictionary -> add it first in 'descriptiondefinition'")
+        else:
+            if description.type_constraint == 'value_in_dictionary' and self.not_valid_action == 'add_to_dictionary':
+                # --- no check, but the dictionary is kept up to date
+                description.M_is_valid_v(value_l, self.not_valid_action)
+            is_valid_v = None
+        if self.instrumentation is not None:
+            time_validated = time.perf_counter()
+            self.instrumentation.M_add('validation', time_validated - time_start)
+
+        # --- create the atoms
+        atom_l = [{'value': value} for value in value_l]
+        for key, column_v in column_d.items():
+            for atom, column in zip(atom_l, column_v.tolist()):
+                atom[key] = column
+        if is_valid_v is not None and not np.all(is_valid_v):
+            atom_l = [atom if is_valid else None for atom, is_valid in zip(atom_l, is_valid_v)]
+
+        entry_l = self.data['collection']['entry']
+        index = self.index_d.get(description_name)
+        journal_entry_atom_l = []
+        for num_entry, start, stop in zip(entry_index_v.tolist(), offset_v[:-1].tolist(), offset_v[1:].tolist()):
+            entry_atom_l = atom_l[start:stop]
+            if is_valid_v is not None:
+                entry_atom_l = [atom for atom in entry_atom_l if atom is not None]
+            if self.journal_fid is not None:
+                journal_entry_atom_l.append([num_entry, entry_atom_l])
+            if entry_atom_l:
+                self.M_get_atom_l(num_entry, description_name).extend(entry_atom_l)
+            else:
+                entry_l[num_entry].setdefault(description_name, [])
+            if index is not None:
+                index.M_add(num_entry, entry_atom_l)
+            if is_deferred and validate == 'full':
+                self.pending_filepath_l.extend((num_entry, description_name, atom) for atom in entry_atom_l)
+            if self.time_index_d:
+                self.time_index_d.pop((num_entry, description_name), None)
+            if self.key_index_d is not None and description_name == 'filepath':
+                self.M_update_key(num_entry, None)
+        if self.time_index_d:
+            self.time_index_d.pop((None, description_name), None)
+        self.M_journal({'op': 'append_atoms', 'description_name': description_name, 'entry_atom_l': journal_entry_atom_l})
+        if self.instrumentation is not None:
+            self.instrumentation.M_add('storage', time.perf_counter() - time_validated)
+
+
+    # ===============================================
+    def M_update_entry(self, 
+                        description_name,
+                        value_l=[],
+                        confidence_l=[],
+                        time_l=[],
+                        duration_l=[],
+                        start_freq_l=[], 
+                        end_freq_l=[], 
+                        comment='',
+                        validate=None,
+                        num_entry=None,
+                        filepath=None):
+        """
+        Add an atom to the description 'description_name' of the current entry
+            validate: 'full' or 'trusted' (default: self.validate)
+            num_entry: index of the entry to be updated (default: the current entry)
+            filepath: 'filepath' value of the entry to be updated (instead of num_entry, see M_get_num_entry)
+        """
+        if num_entry is None and filepath is None:
+            num_entry = self.current_position
+        else:
+            num_entry = self.M_get_num_entry(num_entry, filepath)
+        F_prefix = lambda: f"ERROR updating self.data['collection']['entry'][{num_entry}]['{description_name}']:\n\t"
+
+        description = self.M_get_description(description_name)
+        if description is None:
+            raise Exception(f"{F_prefix()} '{description_name}' is not part of 'descriptiondefinition' -> add it first in 'descriptiondefinition'")
+
+        if validate is None:
+            validate = self.validate
+        entry = self.data['collection']['entry'][num_entry]
+        if self.instrumentation is not None:
+            time_start = time.perf_counter()
+
+        if validate == 'trusted':
+            value_l, confidence_l, time_l, duration_l, start_freq_l, end_freq_l = description.M_convert(value_l, confidence_l, time_l, duration_l, start_freq_l, end_freq_l)
+            if description.type_constraint == 'value_in_dictionary' and self.not_valid_action == 'add_to_dictionary':
+                # --- no check, but the dictionary is kept up to date
+                description.M_is_valid(value_l, self.not_valid_action)
+            is_valid = True
+
+        else:
+            time_entry_l = None
+            if description.type_extent == 'breakpoint_value':
+                # --- Look for the name of the corresponding breakpoint_time
+                # -- in descriptiondefinition
+                time_name_l = self.extent_name_d.get('breakpoint_time', [])
+                if len(time_name_l) == 0:
+                    raise Exception(f"{F_prefix()} no 'breakpoint_time' has been defined in 'descriptiondefinition'")
+                time_entry_l = entry.get(time_name_l[-1])
+
+            value_l, confidence_l, time_l, duration_l, start_freq_l, end_freq_l = description.M_check(value_l, confidence_l, time_l, duration_l, start_freq_l, end_freq_l, time_entry_l, F_prefix)
+            is_deferred = description.type_constraint == 'filepath' and self.filepath_check == 'deferred'
+            is_valid = is_deferred or description.M_is_valid(value_l, self.not_valid_action, self.filepath_checker)
+        if self.instrumentation is not None:
+            time_validated = time.perf_counter()
+            self.instrumentation.M_add('validation', time_validated - time_start)
+
+        if is_valid:
+            atom = description.M_atom(value_l, confidence_l, time_l, duration_l, start_freq_l, end_freq_l, comment)
+            self.M_get_atom_l(num_entry, description_name).append(atom)
+            if validate != 'trusted' and is_deferred:
+                self.pending_filepath_l.append((num_entry, description_name, atom))
+            if description_name in self.index_d:
+                self.index_d[description_name].M_add(num_entry, [atom])
+            if self.time_index_d:
+                self.time_index_d.pop((num_entry, description_name), None)
+                self.time_index_d.pop((None, description_name), None)
+            if self.key_index_d is not None and description_name == 'filepath':
+                self.M_update_key(num_entry, None)
+            self.M_journal({'op': 'append_atoms', 'description_name': description_name, 'entry_atom_l': [[num_entry, [atom]]]})
+            if self.instrumentation is not None:
+                self.instrumentation.M_add('storage', time.perf_counter() - time_validated)
+
+        else:
+
+            if self.not_valid_action == 'filter_out':
+                print(f"{F_prefix()} 'value'({value_l}) is not part of dictionary -> filtering-out")
+            else:
+                raise Exception(f"{F_prefix()} 'value'({value_l}) is not part of the dictionary -> add it first in 'descriptiondefinition'")
+            # --- END: Check validity of the entry
+
+
+
+    # ===============================================
+    def M_get_key_index(self):
+        """
+        return the dictionary 'filepath' value -> index of the entry (created at the first call, then maintained when atoms are added)
+        """
+
+        if self.key_index_d is None:
+            self.key_index_d = {}
+            for num_entry, entry in enumerate(self.data['collection']['entry']):
+                key = F_entry_key(entry, 'filepath')
+                if key is not None:
+                    self.key_index_d.setdefault(key, num_entry)
+        return self.key_index_d
+
+
+    # ===============================================
+    def M_update_key(self, num_entry, old_key):
+        """
+        update the key index after a change of the 'filepath' of an entry (old_key: its previous key)
+        """
+
+        if old_key is not None and self.key_index_d.get(old_key) == num_entry:
+            del self.key_index_d[old_key]
+        key = F_entry_key(self.data['collection']['entry'][num_entry], 'filepath')
+        if key is not None:
+            self.key_index_d.setdefault(key, num_entry)
+
+
+    # ===============================================
+    def M_get_num_entry(self, num_entry=None, filepath=None):
+        """
+        return the index of an entry given by its index (negative values count from the end) or by its 'filepath' value
+            default: the current entry
+        """
+
+        if filepath is not None:
+            num_entry = self.M_get_key_index().get(filepath)
+            if num_entry is None:
+                raise Exception(f"ERROR: there is no entry with 'filepath' '{filepath}'")
+            return num_entry
+        if num_entry is None:
+            return self.current_position
+        nb_entry = len(self.data['collection']['entry'])
+        if num_entry < 0:
+            num_entry += nb_entry
+        if not 0 <= num_entry < nb_entry:
+            raise Exception(f"ERROR: entry {num_entry} does not exist ({nb_entry} entries)")
+        return num_entry
+
+
+    # ===============================================
+    def M_get_atom_l(self, num_entry, description_name):
+        """
+        return the list of atoms of a description of an entry, before new atoms are appended to it
+            the list is created if the description has been defined after the entry,
+            the empty 'value' created by M_check for a missing description is removed
+        """
+
+        atom_l = self.data['collection']['entry'][num_entry].setdefault(description_name, [])
+        if F_is_empty_value(atom_l):
+            old_atom = atom_l.pop()
+            if description_name in self.index_d:
+                self.index_d[description_name].M_remove(num_entry, [old_atom], atom_l)
+        return atom_l
+
+
+    # ===============================================
+    def M_replace_atom(self,
+                       description_name,
+                       num_atom,
+                       value_l=[],
+                       confidence_l=[],
+                       time_l=[],
+                       duration_l=[],
+                       start_freq_l=[],
+                       end_freq_l=[],
+                       comment='',
+                       validate=None,
+                       num_entry=None,
+                       filepath=None):
+        """
+        Replace the atom num_atom of the description 'description_name' of an entry
+            the new atom is checked as in M_update_entry (if it is filtered-out the atom is not replaced)
+            num_entry, filepath: entry to be updated (see M_get_num_entry), default: the current entry
+        """
+
+        num_entry = self.M_get_num_entry(num_entry, filepath)
+        atom_l = self.data['collection']['entry'][num_entry].get(description_name, [])
+        if not -len(atom_l) <= num_atom < len(atom_l):
+            raise Exception(f"ERROR replacing self.data['collection']['entry'][{num_entry}]['{description_name}'][{num_atom}]: the atom does not exist")
+        num_atom %= len(atom_l)
+        if F_is_empty_value(atom_l):
+            # --- the empty 'value' of M_check is replaced by the new atom (see M_get_atom_l)
+            self.M_update_entry(description_name, value_l=value_l, confidence_l=confidence_l, time_l=time_l, duration_l=duration_l,
+                                start_freq_l=start_freq_l, end_freq_l=end_freq_l, comment=comment, validate=validate, num_entry=num_entry)
+            return
+
+        nb_atom = len(atom_l)
+        is_journal_paused = self.is_journal_paused
+        self.is_journal_paused = True
+        try:
+            self.M_update_entry(description_name, value_l=value_l, confidence_l=confidence_l, time_l=time_l, duration_l=duration_l,
+                                start_freq_l=start_freq_l, end_freq_l=end_freq_l, comment=comment, validate=validate, num_entry=num_entry)
+        finally:
+            self.is_journal_paused = is_journal_paused
+        if len(atom_l) == nb_atom:
+            return
+        self.M_journal({'op': 'replace_atom', 'num_entry': num_entry, 'description_name': description_name, 'num_atom': num_atom, 'atom': atom_l[-1]})
+        self.M_replace_by_last_atom(num_entry, description_name, num_atom)
+
+
+    # ===============================================
+    def M_replace_by_last_atom(self, num_entry, description_name, num_atom):
+        """
+        move the last atom (just added) of the description of an entry to the position num_atom (replacing the atom there)
+        """
+
+        entry = self.data['collection']['entry'][num_entry]
+        atom_l = entry[description_name]
+        old_key = F_entry_key(entry, 'filepath') if self.key_index_d is not None and description_name == 'filepath' else None
+        old_atom = atom_l[num_atom]
+        atom_l[num_atom] = atom_l.pop()
+        self.dirty_entry_s.add(num_entry)
+        if description_name in self.index_d:
+            self.index_d[description_name].M_remove(num_entry, [old_atom], atom_l)
+        if self.time_index_d:
+            self.time_index_d.pop((num_entry, description_name), None)
+            self.time_index_d.pop((None, description_name), None)
+        if self.key_index_d is not None and description_name == 'filepath':
+            self.M_update_key(num_entry, old_key)
+
+
+    # ===============================================
+    def M_delete_atom(self, description_name, num_atom=None, num_entry=None, filepath=None):
+        """
+        Delete the atom num_atom (default: all the atoms) of the description 'description_name' of an entry
+            num_entry, filepath: entry to be updated (see M_get_num_entry), default: the current entry
+        """
+
+        num_entry = self.M_get_num_entry(num_entry, filepath)
+        atom_l = self.data['collection']['entry'][num_entry].get(description_name, [])
+        if num_atom is None:
+            num_atom_l = list(range(len(atom_l) - 1, -1, -1))
+        elif -len(atom_l) <= num_atom < len(atom_l):
+            num_atom_l = [num_atom % len(atom_l)]
+        else:
+            raise Exception(f"ERROR deleting self.data['collection']['entry'][{num_entry}]['{description_name}'][{num_atom}]: the atom does not exist")
+
+        for num_atom in num_atom_l:
+            self.M_journal({'op': 'remove_atom', 'num_entry': num_entry, 'description_name': description_name, 'num_atom': num_atom})
+            self.M_remove_atom(num_entry, description_name, num_atom)
+
+
+    # ===============================================
+    def M_remove_atom(self, num_entry, description_name, num_atom):
+        """
+        remove an atom and update the indexes
+        """
+
+        entry = self.data['collection']['entry'][num_entry]
+        old_key = F_entry_key(entry, 'filepath') if self.key_index_d is not None and description_name == 'filepath' else None
+        atom = entry[description_name].pop(num_atom)
+        self.dirty_entry_s.add(num_entry)
+        if description_name in self.index_d:
+            self.index_d[description_name].M_remove(num_entry, [atom], entry[description_name])
+        if self.time_index_d:
+            self.time_index_d.pop((num_entry, description_name), None)
+            self.time_index_d.pop((None, description_name), None)
+        if self.key_index_d is not None and description_name == 'filepath':
+            self.M_update_key(num_entry, old_key)
+
+
+    # ===============================================
+    def M_check_filepath(self):
+        """
+        Check (in bulk) the 'filepath' values added since the last call (filepath_check='deferred')
+            the atoms with files which do not exist are removed (not_valid_action='filter_out')
+            or an exception is raised listing them
+        """
+
+        if not self.pending_filepath_l:
+            return
+
+        pending_filepath_l = self.pending_filepath_l
+        self.pending_filepath_l = []
+        is_file_d = self.filepath_checker.M_is_file_d(value for num_entry, description_name, atom in pending_filepath_l for value in F_flatten_value(atom.get('value', [])))
+
+        not_valid_l = [(num_entry, description_name, atom) for num_entry, description_name, atom in pending_filepath_l
+                       if not all(is_file_d[value] for value in F_flatten_value(atom.get('value', [])))]
+        if not not_valid_l:
+            return
+
+        prefix = f"ERROR checking 'filepath' of {len(not_valid_l)} atoms:\n\t"
+        example_l = [f"self.data['collection']['entry'][{num_entry}]['{description_name}']: {atom.get('value')}" for num_entry, description_name, atom in not_valid_l[:10]]
+        if self.not_valid_action == 'filter_out':
+            print(f"{prefix} files do not exist -> filtering-out\n\t" + "\n\t".join(example_l))
+            entry_l = self.data['collection']['entry']
+            for num_entry, description_name, atom in not_valid_l:
+                for num_atom, entry_atom in enumerate(entry_l[num_entry][description_name]):
+                    if entry_atom is atom:
+                        del entry_l[num_entry][description_name][num_atom]
+                        self.M_journal({'op': 'remove_atom', 'num_entry': num_entry, 'description_name': description_name, 'num_atom': num_atom})
+                        break
+            self.M_reset_index()
+        else:
+            # --- the atoms stay in the collection: they are kept pending (checked again at the next call)
+            self.pending_filepath_l = pending_filepath_l + self.pending_filepath_l
+            raise Exception(f"{prefix} files do not exist\n\t" + "\n\t".join(example_l))
+
+
+    # ===============================================
+    def M_check(self, full=False):
+        """
+        Parse an existing pyjama structure
+            Check for ALL entries
+                That ALL descriptiondefinition exist
+                If not, creates an empty 'value' for this descriptiondefinition (fill='eager')
+            Check the 'filepath' which have not been checked yet (see M_check_filepath)
+        Only the entries added or modified (atoms removed or replaced) since the last call are checked,
+        and the other entries only for the descriptions defined since the last call
+            full: if True all entries are checked (use it after modifying self.data directly)
+        """
+
+        self.M_check_filepath()
+        self.M_journal({'op': 'check', 'full': full})
+        if self.fill == 'lazy':
+            return
+
+        key_l = list(self.data['collection']['descriptiondefinition'].keys())
+        entry_l = self.data['collection']['entry']
+        nb_entry = len(entry_l)
+
+        if full:
+            num_entry_l = range(nb_entry)
+        else:
+            num_entry_l = sorted(num_entry for num_entry in self.dirty_entry_s if num_entry < self.checked_position)
+            new_key_l = [key for key in key_l if key not in self.checked_name_s]
+            if new_key_l:
+                # --- the checked entries only miss the new descriptions
+                for num_entry in range(self.checked_position):
+                    if num_entry not in self.dirty_entry_s:
+                        for key in F_missing_key_l(entry_l[num_entry], new_key_l):
+                            self.M_fill_empty_value(num_entry, key)
+            num_entry_l = num_entry_l + list(range(self.checked_position, nb_entry))
+
+        for num_entry in num_entry_l:
+            for key in F_missing_key_l(entry_l[num_entry], key_l):
+                self.M_fill_empty_value(num_entry, key)
+
+        self.checked_position = nb_entry
+        self.checked_name_s = set(key_l)
+        self.dirty_entry_s = set()
+
+
+    # ===============================================
+    def M_fill_empty_value(self, num_entry, description_name):
+        """
+        replace the atoms of a description of an entry by an empty 'value' (used by M_check)
+        and update the indexes of the description
+        """
+
+        entry = self.data['collection']['entry'][num_entry]
+        old_atom_l = entry.get(description_name, [])
+        atom_l = [{'value': ''}]
+        entry[description_name] = atom_l
+        if description_name in self.index_d:
+            self.index_d[description_name].M_remove(num_entry, old_atom_l, atom_l)
+            self.index_d[description_name].M_add(num_entry, atom_l)
+        if self.time_index_d:
+            self.time_index_d.pop((num_entry, description_name), None)
+            self.time_index_d.pop((None, description_name), None)
+
+
+    # ===============================================
+    def M_iter_entries(self):
+        """
+        yield the entries of the collection,
+            with fill='lazy' the missing descriptions are added ({'value': ''}) to a copy of the entry (the entries are not modified)
+        """
+
+        if self.fill == 'eager':
+            yield from self.data['collection']['entry']
+            return
+        key_l = list(self.data['collection']['descriptiondefinition'].keys())
+        for entry in self.data['collection']['entry']:
+            missing_key_l = F_missing_key_l(entry, key_l)
+            if missing_key_l:
+                entry = dict(entry)
+                for key in missing_key_l:
+                    entry[key] = [{'value': ''}]
+            yield entry
+
+    # ===============================================
+    def M_load(self, fileName):
+        """
+        Load a pyjama file into the current structure
+            The 'descriptiondefinition' are re-created using M_add_definition (and therefore validated),
+            the entries are read one at a time and their structure is checked: each description must be part of
+            'descriptiondefinition' and store a list of atoms (dictionaries).
+            The values of the atoms are not checked against the definitions (the file is trusted)
+        """
+
+        print("reading pyjama file: %s" % (fileName))
+        is_journal_paused = self.is_journal_paused
+        self.is_journal_paused = True
+        try:
+            with C_pyjama_reader(fileName) as reader:
+
+                self.M_reset_collection(reader.schemaversion if reader.schemaversion is not None else '1.41', {}, [])
+
+                for description_name, definition in reader.descriptiondefinition.items():
+                    self.M_add_definition(description_name,
+                                          type_constraint=definition.get('type_constraint', 'free'),
+                                          type_content=definition.get('type_content', 'text'),
+                                          type_extent=definition.get('type_extent', 'global'),
+                                          row_name=definition.get('row_name', []),
+                                          generator=definition.get('generator', {}),
+                                          dictionary=definition.get('dictionary', []),
+                                          is_table=definition.get('is_table', True),
+                                          is_editable=definition.get('is_editable', True),
+                                          is_filter=definition.get('is_filter', True))
+
+                key_l = self.data['collection']['descriptiondefinition'].keys()
+                for num_entry, entry in enumerate(reader):
+                    if not isinstance(entry, dict):
+                        raise Exception(f"ERROR reading {fileName}: 'entry'[{num_entry}] must be a dictionary")
+                    for description_name, atom_l in entry.items():
+                        if description_name not in key_l:
+                            raise Exception(f"ERROR reading {fileName}: 'entry'[{num_entry}]['{description_name}'] is not part of 'descriptiondefinition'")
+                        if not isinstance(atom_l, list):
+                            raise Exception(f"ERROR reading {fileName}: 'entry'[{num_entry}]['{description_name}'] must be a list")
+                        for atom in atom_l:
+                            if not isinstance(atom, dict):
+                                raise Exception(f"ERROR reading {fileName}: the atoms of 'entry'[{num_entry}]['{description_name}'] must be dictionaries")
+                    self.data['collection']['entry'].append(entry)
+                    self.current_position += 1
+        finally:
+            self.is_journal_paused = is_journal_paused
+
+
+    # ===============================================
+    def M_copy_definition(self):
+        """
+        return a new C_pyjama with the same options and a copy of the 'descriptiondefinition' (but no entry)
+        """
+
+        other = C_pyjama(not_valid_action=self.not_valid_action, sidecar=self.sidecar, validate=self.validate,
+                         filepath_check=self.filepath_check, filepath_ttl=self.filepath_checker.ttl, fill=self.fill)
+        other.data['schemaversion'] = self.data['schemaversion']
+        other.data['collection']['descriptiondefinition'] = copy.deepcopy(self.data['collection']['descriptiondefinition'])
+        for description_name in other.data['collection']['descriptiondefinition'].keys():
+            other.M_compile_definition(description_name)
+        return other
+
+
+    # ===============================================
+    def M_merge(self, other):
+        """
+        Append the entries of another C_pyjama (the entries are not copied)
+            The 'descriptiondefinition' of both are reconciled:
+            - descriptions only defined in other are added
+            - for descriptions defined in both, 'type_extent', 'type_content', 'type_constraint' and 'row_name' must be equal,
+                'text' dictionaries are merged and 'numeric' dictionaries [min, max] are widened
+        """
+
+        self.M_journal({'op': 'merge', 'descriptiondefinition': other.data['collection']['descriptiondefinition'], 'entry': other.data['collection']['entry']})
+
+        definition_d = self.data['collection']['descriptiondefinition']
+        new_name_l = []
+        for description_name, other_definition in other.data['collection']['descriptiondefinition'].items():
+
+            if description_name not in definition_d:
+                definition_d[description_name] = copy.deepcopy(other_definition)
+                self.M_compile_definition(description_name)
+                new_name_l.append(description_name)
+                continue
+
+            definition = definition_d[description_name]
+            prefix = f"ERROR merging self.data['collection']['descriptiondefinition']['{description_name}']:\n\t"
+            for key in ['type_extent', 'type_content', 'type_constraint']:
+                if definition[key] != other_definition[key]:
+                    raise Exception(f"{prefix} '{key}' are different ('{definition[key]}' and '{other_definition[key]}')")
+            if list(definition.get('row_name', [])) != list(other_definition.get('row_name', [])):
+                raise Exception(f"{prefix} 'row_name' are different")
+
+            dictionary = definition['dictionary']
+            other_dictionary = other_definition['dictionary']
+            if definition['type_content'] == 'numeric' and definition['type_constraint'] == 'value_in_dictionary':
+                if len(dictionary) < 2:
+                    dictionary[:] = other_dictionary
+                elif len(other_dictionary) >= 2:
+                    dictionary[:] = [min(dictionary[0], other_dictionary[0]), max(dictionary[1], other_dictionary[1])]
+            else:
+                dictionary_set = set(dictionary)
+                for value in other_dictionary:
+                    if value not in dictionary_set:
+                        dictionary.append(value)
+                        dictionary_set.add(value)
+
+        key_l = list(definition_d.keys())
+        nb_entry = len(self.data['collection']['entry'])
+        self.pending_filepath_l.extend((nb_entry + num_entry, description_name, atom) for num_entry, description_name, atom in other.pending_filepath_l)
+        if new_name_l:
+            for entry in self.data['collection']['entry']:
+                for description_name in new_name_l:
+                    entry.setdefault(description_name, [])
+        for entry in other.data['collection']['entry']:
+            for description_name in key_l:
+                if description_name not in entry:
+                    entry[description_name] = []
+            self.data['collection']['entry'].append(entry)
+        self.current_position = len(self.data['collection']['entry']) - 1
+        self.M_reset_index()
+
+
+    # ===============================================
+    def M_reset_index(self):
+        """
+        remove the indexes (they are re-created when needed) and the state of the last M_check (the next M_check checks all entries)
+        """
+
+        self.index_d = {}
+        self.time_index_d = {}
+        self.key_index_d = None
+        self.checked_position = 0
+        self.checked_name_s = set()
+        self.dirty_entry_s = set()
+
+
+    # ===============================================
+    def M_reset_collection(self, schemaversion, descriptiondefinition, entry_l):
+        """
+        replace the collection (M_load, M_load_columnar, M_open_journal, M_open_sharded)
+            the definitions are compiled, the indexes are removed and the sharded collection (M_open_sharded) is closed
+        """
+
+        if self.shard_store is not None:
+            self.shard_store.M_close()
+            self.shard_store = None
+        self.data = {'schemaversion': schemaversion,
+                     'collection': {'descriptiondefinition': descriptiondefinition, 'entry': entry_l}}
+        self.description_d = {}
+        self.extent_name_d = {}
+        for description_name in descriptiondefinition.keys():
+            self.M_compile_definition(description_name)
+        self.current_position = len(entry_l) - 1
+        self.pending_filepath_l = []
+        self.M_reset_index()
+
+
+    # ===============================================
+    def M_get_index(self, description_name):
+        """
+        return the C_value_index of a description (created at the first call)
+        """
+
+        index = self.index_d.get(description_name)
+        if index is None:
+            description = self.M_get_description(description_name)
+            if description is None:
+                raise Exception(f"ERROR selecting '{description_name}': it is not part of 'descriptiondefinition'")
+            if not description.definition.get('is_filter', False):
+                raise Exception(f"ERROR selecting '{description_name}': it is not defined with is_filter=True")
+            if description.type_extent in SIDECAR_EXTENT_L:
+                raise Exception(f"ERROR selecting '{description_name}': '{description.type_extent}' descriptions can not be used for selection")
+            index = C_value_index(description)
+            for num_entry, entry in enumerate(self.data['collection']['entry']):
+                if description_name in entry:
+                    index.M_add(num_entry, entry[description_name])
+            self.index_d[description_name] = index
+        return index
+
+
+    # ===============================================
+    def M_select(self, criterion_d={}, **criterion_kwargs):
+        """
+        Return the (sorted) list of the indices of the entries matching all criteria
+            'numeric' description: (min_value, max_value) range (bounds included) or a single value
+            'text' description: a single value or a list/set/tuple of values (any of them)
+        The criteria are given as keyword arguments or as a dictionary (for description names which are not python identifiers)
+
+        my.M_select(genre='blues', tempo=(120, 130))
+        my.M_select({'release-date': ['1999', '2000']})
+        """
+
+        criterion_d = dict(criterion_d, **criterion_kwargs)
+        entry_s = None
+        for description_name, criterion in criterion_d.items():
+            selected_s = self.M_get_index(description_name).M_select(criterion)
+            entry_s = selected_s if entry_s is None else entry_s & selected_s
+            if not entry_s:
+                break
+        if entry_s is None:
+            return list(range(len(self.data['collection']['entry'])))
+        return sorted(entry_s)
+
+
+    # ===============================================
+    def M_find_time(self, description_name, time_start, time_end=None, num_entry=None, mode='overlap'):
+        """
+        Find the atoms of a 'marker' or 'segment' description by time
+            time_end is None: atoms active at time_start (start <= time_start < end), markers at time_start
+            mode='overlap': atoms overlapping [time_start, time_end] (markers inside [time_start, time_end])
+            mode='within': atoms inside [time_start, time_end]
+            num_entry: index of the entry to search in (negative values count from the end), None to search in the whole collection
+        Return the list (in time order) of dictionaries with keys
+            'entry', 'atom' (position in the description list), 'item' (position in the 'time' list of the atom or -1),
+            'value', 'time', 'duration'
+        The temporal indexes are created at the first query and kept until the description is modified
+
+        my.M_find_time('structtype', 42.3, num_entry=0)
+        my.M_find_time('beat', 10., 20.)
+        """
+
+        description = self.M_get_description(description_name)
+        if description is None:
+            raise Exception(f"ERROR finding '{description_name}': it is not part of 'descriptiondefinition'")
+        if description.type_extent not in ['marker', 'segment']:
+            raise Exception(f"ERROR finding '{description_name}': only 'marker' and 'segment' descriptions can be searched by time")
+
+        entry_l = self.data['collection']['entry']
+        if num_entry is not None:
+            num_entry = self.M_get_num_entry(num_entry)
+        time_index = self.time_index_d.get((num_entry, description_name))
+        if time_index is None:
+            if num_entry is None:
+                time_index = C_time_index(enumerate(entry_l), description_name)
+            else:
+                time_index = C_time_index([(num_entry, entry_l[num_entry])], description_name)
+            self.time_index_d[(num_entry, description_name)] = time_index
+
+        found_l = []
+        for position in time_index.M_query(time_start, time_end, mode).tolist():
+            found_entry = int(time_index.num_entry_v[position])
+            num_atom = int(time_index.num_atom_v[position])
+            num_item = int(time_index.num_item_v[position])
+            atom = entry_l[found_entry][description_name][num_atom]
+            value = atom.get('value')
+            if num_item >= 0 and isinstance(value, list):
+                # --- one value per time: [v1, v2, ...] or [[v1, v2, ...]]
+                if len(value) == 1 and isinstance(value[0], list):
+                    value = value[0]
+                if len(value) == len(atom['time']):
+                    value = value[num_item]
+            found_l.append({'entry': found_entry,
+                            'atom': num_atom,
+                            'item': num_item,
+                            'value': value,
+                            'time': float(time_index.start_v[position]),
+                            'duration': float(time_index.end_v[position] - time_index.start_v[position])})
+        return found_l
+
+
+    # ===============================================
+    def M_build_pyramid(self, description_name=None, factor=4):
+        """
+        Add to the atoms of the 'breakpoint' and 'breakpoint_value' descriptions a min/max/mean pyramid of their 'value' (key 'pyramid', see F_build_pyramid)
+            used by M_get_breakpoint to display long breakpoints without reading all their values
+            description_name: description to be processed (default: all 'breakpoint' and 'breakpoint_value' descriptions)
+        """
+
+        if description_name is None:
+            name_l = self.extent_name_d.get('breakpoint', []) + self.extent_name_d.get('breakpoint_value', [])
+        else:
+            description = self.M_get_description(description_name)
+            if description is None or description.type_extent not in ['breakpoint', 'breakpoint_value']:
+                raise Exception(f"ERROR building pyramid of '{description_name}': it is not a 'breakpoint' or 'breakpoint_value' description")
+            name_l = [description_name]
+
+        for description_name in name_l:
+            keep_array = self.description_d[description_name].keep_array
+            for entry in self.data['collection']['entry']:
+                for atom in entry.get(description_name, []):
+                    if not F_has_value(atom.get('value', [])):
+                        continue
+                    pyramid = F_build_pyramid(atom['value'], factor)
+                    if not keep_array:
+                        for level in pyramid['level']:
+                            for key in PYRAMID_KEY_L:
+                                level[key] = level[key].tolist()
+                    atom['pyramid'] = pyramid
+
+
+    # ===============================================
+    def M_get_breakpoint(self, description_name, time_start, time_end, nb_point=None, num_atom=0, num_entry=None, filepath=None):
+        """
+        Return the part [time_start, time_end] of a 'breakpoint' or 'breakpoint_value' atom with (at least) nb_point points
+            using its pyramid if it has one (see M_build_pyramid and F_reduce_breakpoint)
+            num_entry, filepath: entry to be read (see M_get_num_entry), default: the current entry
+                (read from disk if a sharded collection is open, see M_open_sharded: num_entry or filepath must then be given)
+        return {'time': (nb_point), 'min': (nb_dim, nb_point), 'max': ..., 'mean': ...}
+        """
+
+        description = self.M_get_description(description_name)
+        if description is None or description.type_extent not in ['breakpoint', 'breakpoint_value']:
+            raise Exception(f"ERROR reading '{description_name}': it is not a 'breakpoint' or 'breakpoint_value' description")
+        if self.shard_store is not None:
+            if filepath is not None:
+                entry = self.shard_store.M_get_entry_by_filepath(filepath)
+                if entry is None:
+                    raise Exception(f"ERROR reading '{description_name}': there is no entry with 'filepath' '{filepath}' in {self.shard_store.dirName}")
+            elif num_entry is not None:
+                entry = self.shard_store.M_get_entry(num_entry)
+            else:
+                raise Exception(f"ERROR reading '{description_name}': num_entry or filepath must be given when a sharded collection is open (there is no current entry)")
+        else:
+            entry = self.data['collection']['entry'][self.M_get_num_entry(num_entry, filepath)]
+        atom = entry[description_name][num_atom]
+
+        if description.type_extent == 'breakpoint':
+            time_v = atom['time']
+        else:
+            time_name_l = self.extent_name_d.get('breakpoint_time', [])
+            if len(time_name_l) == 0:
+                raise Exception(f"ERROR reading '{description_name}': no 'breakpoint_time' has been defined in 'descriptiondefinition'")
+            time_v = entry[time_name_l[-1]][0]['value']
+        return F_reduce_breakpoint(time_v, atom['value'], atom.get('pyramid'), time_start, time_end, nb_point)
+
+
+    # ===============================================
+    def M_to_columnar(self):
+        """
+        Return the collection as columns (struct-of-arrays), one dictionary of np.ndarray for each description:
+            'entry_id': (nb_row) index of the entry
+            'atom_id': (nb_row) position of the atom in the description list of the entry
+            'value': (nb_row) float for 'numeric' (np.nan if there is no value),
+                     (nb_row) int code in 'dictionary' for 'text' (-1 if there is no value),
+                     (nb_row, nb_dim) float for 'breakpoint', 'breakpoint_time', 'breakpoint_value' and descriptions with 'row_name'
+                     (int if all the values of the description are int)
+            'time', 'duration', 'confidence', 'start_freq', 'end_freq': (nb_row) float (np.nan if not defined)
+            'dictionary': list of the text values ('dictionary' of the definition followed by the other values)
+            'value_depth': (nb_row) nesting depth of the 'value' of the atom (see F_value_depth), not for matrices
+            'is_empty': (nb_row) True for the row of an empty 'value' '' (created by M_check), not for 'text'
+                (the row has np.nan values)
+        An atom storing lists (multi-label, lists of time or breakpoint) gives one row per element (or per time for matrices)
+        """
+
+        column_d = {}
+        for description_name, definition in self.data['collection']['descriptiondefinition'].items():
+            description = self.M_get_description(description_name)
+            is_matrix = description.type_extent in SIDECAR_EXTENT_L or description.nb_row_name > 0
+            is_text = description.type_content == 'text' and not is_matrix
+
+            # --- the rows are accumulated in python lists (most atoms give a single row)
+            entry_id_l, atom_id_l, value_l, depth_l, empty_l = [], [], [], [], []
+            field_d = {key: [] for key in COLUMNAR_KEY_L}
+            field_item_l = list(field_d.items())
+            nan = np.nan
+            for num_entry, entry in enumerate(self.data['collection']['entry']):
+                for num_atom, atom in enumerate(entry.get(description_name, [])):
+
+                    if is_matrix:
+                        value = atom.get('value', np.zeros((description.nb_row_name, 0)))
+                        if isinstance(value, str):
+                            # --- empty 'value': one row of np.nan (its width is known when all the rows are read)
+                            nb_item = 1
+                            value_l.append(None)
+                            empty_l.append(True)
+                        else:
+                            value_m = np.asarray(value)
+                            if value_m.dtype.kind not in 'iu':
+                                value_m = value_m.astype(float)
+                            if value_m.ndim != 2:
+                                value_m = value_m.reshape((-1, 1))
+                            nb_item = value_m.shape[1]
+                            value_l.append(value_m.T)
+                            empty_l.extend([False] * nb_item)
+                    else:
+                        time = atom.get('time')
+                        nb_item = len(time) if isinstance(time, list) else 1
+                        if 'value' not in atom:
+                            item_l = [None]
+                        elif isinstance(atom['value'], (list, tuple, np.ndarray)):
+                            item_l = F_flatten_value(atom['value'])
+                        else:
+                            item_l = [atom['value']]
+                        if nb_item > 1 and len(item_l) != nb_item:
+                            raise Exception(f"ERROR converting entry[{num_entry}]['{description_name}'][{num_atom}]: {len(item_l)} values for {nb_item} times")
+                        nb_item = len(item_l)
+                        value_l.extend(item_l)
+                        depth_l.extend([F_value_depth(atom.get('value'))] * nb_item)
+                        empty_l.extend(isinstance(item, str) and item == '' for item in item_l)
+
+                    if nb_item == 1:
+                        entry_id_l.append(num_entry)
+                        atom_id_l.append(num_atom)
+                        for key, field_l in field_item_l:
+                            field = atom.get(key, nan)
+                            if type(field) is not float and isinstance(field, (list, np.ndarray)):
+                                field = field[0] if len(field) == 1 else nan
+                            field_l.append(field)
+                    else:
+                        entry_id_l.extend([num_entry] * nb_item)
+                        atom_id_l.extend([num_atom] * nb_item)
+                        for key, field_l in field_d.items():
+                            field = atom.get(key, np.nan)
+                            if isinstance(field, (list, np.ndarray)) and len(field) == nb_item:
+                                field_l.extend(field)
+                            else:
+                                field_l.extend([field if np.isscalar(field) else np.nan] * nb_item)
+
+            column = {'entry_id': np.asarray(entry_id_l, dtype=int),
+                      'atom_id': np.asarray(atom_id_l, dtype=int)}
+            if is_matrix:
+                nb_dim = next((value_m.shape[1] for value_m in value_l if value_m is not None), max(description.nb_row_name, 1))
+                value_l = [np.full((1, nb_dim), np.nan) if value_m is None else value_m for value_m in value_l]
+                column['value'] = np.concatenate(value_l, axis=0) if value_l else np.zeros((0, description.nb_row_name))
+            elif is_text:
+                dictionary = list(definition['dictionary'])
+                code_d = {value: code for code, value in enumerate(dictionary)}
+                code_l = []
+                for value in value_l:
+                    if value is None:
+                        code_l.append(-1)
+                        continue
+                    code = code_d.get(value)
+                    if code is None:
+                        code = code_d[value] = len(dictionary)
+                        dictionary.append(value)
+                    code_l.append(code)
+                column['value'] = np.asarray(code_l, dtype=int)
+                column['dictionary'] = dictionary
+            else:
+                column['value'] = np.asarray([np.nan if value is None or isinstance(value, str) else value for value in value_l], dtype=float)
+            if not is_matrix:
+                column['value_depth'] = np.asarray(depth_l, dtype=np.int8)
+            if not is_text:
+                column['is_empty'] = np.asarray(empty_l, dtype=bool)
+            for key in COLUMNAR_KEY_L:
+                column[key] = np.asarray(field_d[key], dtype=float)
+            column_d[description_name] = column
+
+        return column_d
+
+
+    # ===============================================
+    def M_from_columnar(self, column_d, nb_entry=None):
+        """
+        Add entries from columns (as given by M_to_columnar), the descriptions must already be defined
+            nb_entry: number of entries to be added (default: max('entry_id')+1),
+                'entry_id' are relative to the first added entry
+        The rows of an atom are stored with the nesting given by 'value_depth'
+        (without 'value_depth': a single value as scalar, several values as a list)
+        """
+
+        if nb_entry is None:
+            nb_entry = 1 + max([int(column['entry_id'].max()) for column in column_d.values() if len(column['entry_id'])] + [-1])
+        first_entry = len(self.data['collection']['entry'])
+        self.M_add_entries(nb_entry)
+        entry_l = self.data['collection']['entry']
+
+        for description_name, column in column_d.items():
+            description = self.M_get_description(description_name)
+            if description is None:
+                raise Exception(f"ERROR converting '{description_name}': it is not part of 'descriptiondefinition' -> add it first in 'descriptiondefinition'")
+            is_matrix = column['value'].ndim == 2
+            nb_row = len(column['entry_id'])
+            if nb_row == 0:
+                continue
+
+            order_v = np.lexsort((column['atom_id'], column['entry_id']))
+            entry_id_v = column['entry_id'][order_v]
+            atom_id_v = column['atom_id'][order_v]
+            boundary_v = np.flatnonzero((np.diff(entry_id_v) != 0) | (np.diff(atom_id_v) != 0)) + 1
+            start_l = [0] + boundary_v.tolist()
+            stop_l = boundary_v.tolist() + [nb_row]
+
+            value_v = column['value'][order_v]
+            if 'dictionary' in column:
+                dictionary_v = np.empty(len(column['dictionary']) + 1, dtype=object)
+                dictionary_v[:-1] = column['dictionary']
+                dictionary_v[-1] = None
+                value_v = dictionary_v[value_v]
+            empty_v = column['is_empty'][order_v] if 'is_empty' in column else np.zeros(nb_row, dtype=bool)
+            if not is_matrix:
+                value_v = value_v.tolist()
+                if 'dictionary' not in column:
+                    # --- np.nan: no 'value'
+                    value_v = [value if value == value else None for value in value_v]
+                for position in np.flatnonzero(empty_v).tolist():
+                    value_v[position] = ''
+            depth_l = column['value_depth'][order_v].tolist() if 'value_depth' in column else None
+            # --- np.nan are removed with (field == field)
+            field_d = {key: column[key][order_v].tolist() for key in COLUMNAR_KEY_L if key in column}
+
+            description_atom_l = []
+            for start, stop in zip(start_l, stop_l):
+                atom = {}
+                if stop - start == 1:
+                    if not is_matrix:
+                        if value_v[start] is not None:
+                            atom['value'] = value_v[start] if depth_l is None else F_nest_value(value_v[start:stop], depth_l[start])
+                    elif empty_v[start]:
+                        atom['value'] = ''
+                    else:
+                        atom['value'] = value_v[start:stop].T if description.keep_array else value_v[start:stop].T.tolist()
+                    for key, field_l in field_d.items():
+                        field = field_l[start]
+                        if field == field:
+                            atom[key] = field
+                    description_atom_l.append(atom)
+                    continue
+
+                if is_matrix:
+                    if description.keep_array:
+                        atom['value'] = np.ascontiguousarray(value_v[start:stop].T)
+                    else:
+                        atom['value'] = value_v[start:stop].T.tolist()
+                else:
+                    item_l = value_v[start:stop]
+                    if item_l != [None] * len(item_l):
+                        atom['value'] = F_backward_compatibility(item_l) if depth_l is None else F_nest_value(item_l, depth_l[start])
+                for key, field_l in field_d.items():
+                    field_l = field_l[start:stop]
+                    if all(field != field for field in field_l):
+                        continue
+                    if not is_matrix and all(field == field_l[0] for field in field_l):
+                        atom[key] = field_l[0]
+                    elif description.keep_array and key == 'time':
+                        atom[key] = np.asarray(field_l)
+                    else:
+                        atom[key] = field_l
+                description_atom_l.append(atom)
+
+            journal_entry_atom_l = []
+            for num_entry, atom in zip(entry_id_v[start_l].tolist(), description_atom_l):
+                entry_l[first_entry + num_entry][description_name].append(atom)
+                if self.journal_fid is not None:
+                    journal_entry_atom_l.append([first_entry + num_entry, [atom]])
+            self.M_journal({'op': 'append_atoms', 'description_name': description_name, 'entry_atom_l': journal_entry_atom_l})
+
+        self.M_reset_index()
+
+
+    # ===============================================
+    def M_save_columnar(self, fileName):
+        """
+        Save the collection in columnar format (.npz, see M_to_columnar)
+            the header ('schemaversion', 'descriptiondefinition', number of entries and text dictionaries) is stored as json
+        """
+
+        print("writting pyjama columnar file: %s" % (fileName))
+        column_d = self.M_to_columnar()
+        header = {'schemaversion': self.data['schemaversion'],
+                  'descriptiondefinition': self.data['collection']['descriptiondefinition'],
+                  'nb_entry': len(self.data['collection']['entry']),
+                  'dictionary': {}}
+        array_d = {}
+        for description_name, column in column_d.items():
+            for key, column_v in column.items():
+                if key == 'dictionary':
+                    header['dictionary'][description_name] = column_v
+                else:
+                    array_d[f"{description_name}/{key}"] = column_v
+        array_d['header'] = np.array(json.dumps(header, default=F_json_default))
+        with open(fileName, 'wb') as f:
+            np.savez(f, **array_d)
+
+
+    # ===============================================
+    def M_load_columnar(self, fileName):
+        """
+        Load a collection saved with M_save_columnar into the current structure
+        """
+
+        print("reading pyjama columnar file: %s" % (fileName))
+        header, column_d = F_read_columnar(fileName)
+        is_journal_paused = self.is_journal_paused
+        self.is_journal_paused = True
+        try:
+            self.M_reset_collection(header['schemaversion'], {}, [])
+            for description_name, definition in header['descriptiondefinition'].items():
+                self.M_add_definition(description_name,
+                                      type_constraint=definition.get('type_constraint', 'free'),
+                                      type_content=definition.get('type_content', 'text'),
+                                      type_extent=definition.get('type_extent', 'global'),
+                                      row_name=definition.get('row_name', []),
+                                      generator=definition.get('generator', {}),
+                                      dictionary=definition.get('dictionary', []),
+                                      is_table=definition.get('is_table', True),
+                                      is_editable=definition.get('is_editable', True),
+                                      is_filter=definition.get('is_filter', True))
+            self.M_from_columnar(column_d, nb_entry=header['nb_entry'])
+        finally:
+            self.is_journal_paused = is_journal_paused
+
+
+    # ===============================================
+    def M_import_lab(self, dirName, suffix_d, audio_extension='.mp3', nb_worker=None, validate=None):
+        """
+        Import the .lab annotation files of a directory tree (see F_read_lab)
+            suffix_d: description_name -> suffix of its .lab files, for example {'beat': '.beat.lab', 'structtype': '.struct.lab'}
+                'marker' descriptions use the time of each line,
+                'segment' descriptions use the stop time (or the time of the next line, the last segment then has a null duration)
+            the 'filepath' of a .lab file is its name with the suffix replaced by audio_extension:
+                the annotations are added to the entry with this 'filepath' (see M_get_num_entry) or to a new entry
+            nb_worker: number of processes reading the files (see F_read_lab_l)
+            validate: 'full' or 'trusted' (default: self.validate)
+        """
+
+        print("importing .lab files: %s" % (dirName))
+        if self.M_get_description('filepath') is None:
+            raise Exception("ERROR importing .lab files: 'filepath' is not part of 'descriptiondefinition' -> add it first in 'descriptiondefinition'")
+
+        fileName_l = []
+        import_l = []
+        for description_name, suffix in suffix_d.items():
+            description = self.M_get_description(description_name)
+            if description is None or description.type_extent not in ['marker', 'segment']:
+                raise Exception(f"ERROR importing .lab files: '{description_name}' must be a 'marker' or 'segment' description of 'descriptiondefinition'")
+            lab_fileName_l = sorted(glob.glob(os.path.join(dirName, '**', '*' + suffix), recursive=True))
+            fileName_l.extend(lab_fileName_l)
+            import_l.append((description, [fileName[:-len(suffix)] + audio_extension for fileName in lab_fileName_l]))
+        lab_l = F_read_lab_l(fileName_l, nb_worker)
+
+        # --- entries of the audio files
+        key_index_d = self.M_get_key_index()
+        new_filepath_l = list(dict.fromkeys(filepath for description, filepath_l in import_l for filepath in filepath_l
+                                            if filepath not in key_index_d))
+        if new_filepath_l:
+            self.M_add_entries(len(new_filepath_l))
+            self.M_update_entries('filepath', value_l=new_filepath_l, validate=validate)
+
+        # --- one batch per description
+        num_lab = 0
+        for description, filepath_l in import_l:
+            time_l, duration_l, label_l, offset_l, entry_index_l = [], [], [], [0], []
+            for filepath in filepath_l:
+                time_v, stop_v, lab_label_l = lab_l[num_lab]
+                num_lab += 1
+                if filepath not in key_index_d:
+                    continue
+                if description.type_extent == 'segment':
+                    if stop_v is None:
+                        stop_v = np.append(time_v[1:], time_v[-1:])
+                    duration_l.append(stop_v - time_v)
+                time_l.append(time_v)
+                label_l.extend(lab_label_l)
+                offset_l.append(offset_l[-1] + len(time_v))
+                entry_index_l.append(key_index_d[filepath])
+            if not entry_index_l:
+                continue
+            value_l = label_l
+            if description.type_content == 'numeric':
+                try:
+                    value_l = np.array(label_l, dtype=float)
+                except ValueError:
+                    raise Exception(f"ERROR importing .lab files: the labels of '{description.description_name}' must be numeric")
+            self.M_update_entries(description.description_name, value_l=value_l, time_l=np.concatenate(time_l),
+                                  duration_l=np.concatenate(duration_l) if duration_l else None,
+                                  offset_v=offset_l, entry_index_v=entry_index_l, validate=validate)
+
+
+    # ===============================================
+    def M_journal(self, operation):
+        """
+        append an operation (dictionary with key 'op') to the journal (if a journal is open)
+        """
+
+        if self.journal_fid is not None and not self.is_journal_paused:
+            self.journal_fid.write(json.dumps(operation, default=F_journal_default) + '\n')
+            self.journal_fid.flush()
+
+
+    # ===============================================
+    def M_open_journal(self, fileName):
+        """
+        Open the journal of the collection fileName (journal: fileName + '.journal')
+            the state is first recovered: fileName is loaded (if it exists) and the journal is replayed (if it exists)
+            then each M_add_definition, M_add_entry, M_add_entries, M_update_entry, M_update_entries, M_replace_atom, M_delete_atom,
+            M_check, M_merge and M_flush
+            is appended as one json line to the journal
+            when a new journal is created, its first line stores the current collection (definitions and entries already added)
+        M_checkpoint() forces the journal to disk, M_compact() folds the journal into fileName
+        (M_load and M_load_columnar replace the collection and are not journaled: call M_compact after them)
+        """
+
+        self.M_close_journal()
+        journal_fileName = fileName + '.journal'
+        is_new = not os.path.isfile(fileName) and not os.path.isfile(journal_fileName)
+        if os.path.isfile(fileName):
+            self.M_load(fileName)
+        elif os.path.isfile(journal_fileName):
+            # --- the journal was started on an empty collection
+            self.M_reset_collection('1.41', {}, [])
+        if os.path.isfile(journal_fileName):
+            self.M_replay(journal_fileName)
+            # --- an incomplete last line is removed so that the next operations start on a new line
+            with open(journal_fileName, 'rb+') as fid:
+                size = fid.seek(0, os.SEEK_END)
+                end = size
+                while end > 0:
+                    start = max(0, end - 65536)
+                    fid.seek(start)
+                    pos = fid.read(end - start).rfind(b'\n')
+                    if pos >= 0:
+                        end = start + pos + 1
+                        break
+                    end = start
+                if end < size:
+                    fid.truncate(end)
+        self.journal_fileName = journal_fileName
+        self.journal_fid = open(journal_fileName, 'a')
+        if is_new and (self.data['collection']['descriptiondefinition'] or self.data['collection']['entry']):
+            # --- the collection built before opening the journal is its first operation
+            self.M_journal({'op': 'state',
+                            'schemaversion': self.data['schemaversion'],
+                            'descriptiondefinition': self.data['collection']['descriptiondefinition'],
+                            'entry': self.data['collection']['entry']})
+
+
+    # ===============================================
+    def M_close_journal(self):
+        """
+        """
+
+        if self.journal_fid is not None:
+            self.journal_fid.close()
+        self.journal_fid = None
+        self.journal_fileName = None
+
+
+    # ===============================================
+    def M_checkpoint(self):
+        """
+        force the journal to be written on disk
+        """
+
+        if self.journal_fid is not None:
+            self.journal_fid.flush()
+            os.fsync(self.journal_fid.fileno())
+
+
+    # ===============================================
+    def M_compact(self):
+        """
+        fold the journal into the collection file (which is re-written) and empty the journal
+        """
+
+        if self.journal_fid is None:
+            raise Exception("ERROR compacting: no journal is open (use M_open_journal)")
+
+        fileName = self.journal_fileName[:-len('.journal')]
+        self.M_check_filepath()
+        print("writting pyjama file: %s" % (fileName))
+        # --- the collection is written in a temporary file which replaces fileName only when complete
+        with C_pyjama_writer(fileName + '.tmp', self, sidecar=self.sidecar, sidecar_fileName=F_sidecar_fileName(fileName)) as writer:
+            for entry in self.M_iter_entries():
+                writer.M_write_entry(entry)
+        os.replace(fileName + '.tmp', fileName)
+        self.journal_fid.close()
+        self.journal_fid = open(self.journal_fileName, 'w')
+
+
+    # ===============================================
+    def M_replay(self, journal_fileName):
+        """
+        Apply the operations of a journal to the current structure
+            an incomplete last line (interrupted writing) is ignored
+        """
+
+        print("replaying pyjama journal: %s" % (journal_fileName))
+        decoder = json.JSONDecoder(object_hook=F_journal_object_hook)
+        is_journal_paused = self.is_journal_paused
+        self.is_journal_paused = True
+        try:
+            with open(journal_fileName, 'r') as fid:
+                for num_line, line in enumerate(fid):
+                    try:
+                        operation = decoder.decode(line)
+                    except json.JSONDecodeError:
+                        if line.endswith('\n'):
+                            raise Exception(f"ERROR replaying {journal_fileName}: line {num_line} is not valid")
+                        print(f"{journal_fileName}: incomplete last line {num_line} -> ignored")
+                        break
+                    self.M_replay_operation(operation)
+        finally:
+            self.is_journal_paused = is_journal_paused
+
+
+    # ===============================================
+    def M_replay_operation(self, operation):
+        """
+        """
+
+        op = operation['op']
+        if op == 'state':
+            self.M_reset_collection(operation['schemaversion'], operation['descriptiondefinition'], operation['entry'])
+        elif op == 'add_definition':
+            self.data['collection']['descriptiondefinition'][operation['description_name']] = operation['definition']
+            self.M_compile_definition(operation['description_name'])
+        elif op == 'add_entry':
+            self.M_add_entry()
+        elif op == 'add_entries':
+            self.M_add_entries(operation['nb_entry'])
+        elif op == 'append_atoms':
+            description_name = operation['description_name']
+            for num_entry, atom_l in operation['entry_atom_l']:
+                self.M_append_atom_l(num_entry, description_name, atom_l)
+        elif op == 'remove_atom':
+            self.M_remove_atom(operation['num_entry'], operation['description_name'], operation['num_atom'])
+        elif op == 'replace_atom':
+            self.M_append_atom_l(operation['num_entry'], operation['description_name'], [operation['atom']])
+            self.M_replace_by_last_atom(operation['num_entry'], operation['description_name'], operation['num_atom'])
+        elif op == 'check':
+            self.M_check(full=operation.get('full', False))
+        elif op == 'merge':
+            other = C_pyjama(not_valid_action=self.not_valid_action, sidecar=self.sidecar)
+            other.data['collection']['descriptiondefinition'] = operation['descriptiondefinition']
+            other.data['collection']['entry'] = operation['entry']
+            self.M_merge(other)
+        elif op == 'flush':
+            self.data['collection']['entry'] = []
+            self.current_position = -1
+            self.M_reset_index()
+        else:
+            raise Exception(f"ERROR replaying: unknown operation '{op}'")
+
+
+    # ===============================================
+    def M_append_atom_l(self, num_entry, description_name, atom_l):
+        """
+        append already checked atoms (from a journal) to an entry, the dictionary is updated in 'add_to_dictionary' mode
+        """
+
+        description = self.M_get_description(description_name)
+        if description.type_constraint == 'value_in_dictionary' and self.not_valid_action == 'add_to_dictionary':
+            value_l = [value for atom in atom_l if 'value' in atom for value in F_flatten_value(atom['value'])]
+            if value_l:
+                description.M_is_valid(value_l, self.not_valid_action)
+        if description.keep_array:
+            for atom in atom_l:
+                for key in SIDECAR_KEY_L:
+                    if isinstance(atom.get(key), list):
+                        atom[key] = np.asarray(atom[key])
+        if atom_l:
+            self.M_get_atom_l(num_entry, description_name).extend(atom_l)
+        else:
+            self.data['collection']['entry'][num_entry].setdefault(description_name, [])
+        if description_name in self.index_d:
+            self.index_d[description_name].M_add(num_entry, atom_l)
+        if self.time_index_d:
+            self.time_index_d.pop((num_entry, description_name), None)
+            self.time_index_d.pop((None, description_name), None)
+        if self.key_index_d is not None and description_name == 'filepath':
+            self.M_update_key(num_entry, None)
+
+
+
+    # ===============================================
+    def M_start_instrumentation(self, function=True):
+        """
+        Start counting the calls (and their cumulative time) of the main methods (INSTRUMENTED_METHOD_L)
+        and the time spent in validation and storage by M_update_entry and M_update_entries
+            function: if True the calls of the module functions (INSTRUMENTED_FUNCTION_L) made by the descriptions
+                of this C_pyjama are also counted
+        return the C_instrumentation (see C_instrumentation.M_report)
+        Without instrumentation (default) the methods are not wrapped and nothing is measured
+        Only this C_pyjama is modified: several C_pyjama can be instrumented (and stopped) independently
+        """
+
+        if self.instrumentation is not None:
+            return self.instrumentation
+        instrumentation = C_instrumentation()
+        for name in INSTRUMENTED_METHOD_L:
+            self.__dict__[name] = instrumentation.M_wrap(name, getattr(self, name))
+        self.instrumentation = instrumentation
+        if function:
+            self.function_instrumentation = instrumentation
+            for description in self.description_d.values():
+                self.M_instrument_description(description)
+        return instrumentation
+
+
+    # ===============================================
+    def M_instrument_description(self, description):
+        """
+        replace the module functions called by a description by their counted version
+        """
+
+        for name in INSTRUMENTED_FUNCTION_L:
+            description.__dict__[name] = self.function_instrumentation.M_wrap(name, getattr(C_description, name))
+
+
+    # ===============================================
+    def M_stop_instrumentation(self):
+        """
+        Stop the instrumentation (the methods and functions are restored) and return the C_instrumentation
+        """
+
+        for name in INSTRUMENTED_METHOD_L:
+            self.__dict__.pop(name, None)
+        if self.function_instrumentation is not None:
+            for description in self.description_d.values():
+                for name in INSTRUMENTED_FUNCTION_L:
+                    description.__dict__.pop(name, None)
+            self.function_instrumentation = None
+        instrumentation = self.instrumentation
+        self.instrumentation = None
+        return instrumentation
+
+
+    # ===============================================
+    def M_print(self):
+        """
+        """
+
+        pp.pprint(self.data)
+
+    # ===============================================
+    def M_flush(self, writer):
+        """
+        Write the entries currently in memory with a C_pyjama_writer and remove them from memory
+            (the next M_add_entry will therefore be at position 0)
+        """
+
+        self.M_check_filepath()
+        self.M_journal({'op': 'flush'})
+
+        for entry in self.M_iter_entries():
+            writer.M_write_entry(entry)
+        self.data['collection']['entry'] = []
+        self.current_position = -1
+        self.M_reset_index()
+
+
+    # ===============================================
+    def M_save(self, fileName, compact=False, sidecar=None, pyramid=False):
+        """
+        compact: if True the file is written without indentation and with one entry per line
+        sidecar: if True the breakpoint values are written in a binary sidecar file (default: self.sidecar)
+        pyramid: if True the pyramids of the breakpoint values are built (see M_build_pyramid) and saved with them
+        """
+
+        if sidecar is None:
+            sidecar = self.sidecar
+        self.M_check_filepath()
+        if pyramid:
+            self.M_build_pyramid()
+        print("writting pyjama file: %s" % (fileName))
+        with C_pyjama_writer(fileName, self, compact=compact, sidecar=sidecar) as writer:
+            for entry in self.M_iter_entries():
+                writer.M_write_entry(entry)
+
+
+    # ===============================================
+    def M_save_sharded(self, dirName, nb_entry_per_shard=10000, sidecar=None, key_name='filepath'):
+        """
+        Save the collection as a sharded collection in the directory dirName (see C_pyjama_shard_store)
+            nb_entry_per_shard: number of entries in each shard file
+            sidecar: if True the breakpoint values are written in a binary sidecar file per shard (default: self.sidecar)
+            key_name: description whose value is used as key of the entries (M_get_entry_by_filepath)
+        Each save writes new files (shards, sidecars and index named with the generation of the save),
+        the existing files are never modified: a store opened before the save keeps reading the previous generation.
+        The manifest is replaced last (and atomically) and makes the new generation visible,
+        then the files of the generations before the previous one are removed.
+        """
+
+        if sidecar is None:
+            sidecar = self.sidecar
+        self.M_check_filepath()
+        print("writting pyjama sharded collection: %s" % (dirName))
+        os.makedirs(dirName, exist_ok=True)
+        manifest_fileName = os.path.join(dirName, SHARD_MANIFEST_NAME)
+        previous_fileName_s = set()
+        generation = 0
+        if os.path.isfile(manifest_fileName):
+            with open(manifest_fileName, 'r') as fid:
+                previous_manifest = json.load(fid)
+            generation = previous_manifest.get('generation', -1) + 1
+            previous_fileName_s = set(previous_manifest['shard'])
+            previous_fileName_s.add(previous_manifest.get('index', SHARD_INDEX_NAME))
+
+        entry_iter = self.M_iter_entries()
+        nb_entry = len(self.data['collection']['entry'])
+        definition_d = self.data['collection']['descriptiondefinition']
+        num_shard_v = np.zeros(nb_entry, dtype=np.int32)
+        offset_v = np.zeros(nb_entry, dtype=np.int64)
+        length_v = np.zeros(nb_entry, dtype=np.int64)
+        key_l = []
+        shard_fileName_l = []
+        for num_shard, start in enumerate(range(0, max(nb_entry, 1), nb_entry_per_shard)):
+            shard_fileName = F_shard_fileName(num_shard, generation)
+            shard_fileName_l.append(shard_fileName)
+            with C_pyjama_shard_writer(os.path.join(dirName, shard_fileName), definition_d, sidecar=sidecar) as writer:
+                for num_entry in range(start, min(start + nb_entry_per_shard, nb_entry)):
+                    entry = next(entry_iter)
+                    num_shard_v[num_entry] = num_shard
+                    offset_v[num_entry], length_v[num_entry] = writer.M_write_entry(entry)
+                    key = F_entry_key(entry, key_name)
+                    key_l.append(key if key is not None else '')
+
+        index_fileName = F_shard_index_fileName(generation)
+        with open(os.path.join(dirName, index_fileName), 'wb') as fid:
+            np.savez(fid, shard=num_shard_v, offset=offset_v, length=length_v, key=np.array(key_l, dtype=str))
+        # --- the manifest is written last (and atomically): it makes the new generation visible
+        manifest = {'schemaversion': self.data['schemaversion'],
+                    'descriptiondefinition': definition_d,
+                    'shard': shard_fileName_l,
+                    'index': index_fileName,
+                    'generation': generation,
+                    'key_name': key_name,
+                    'nb_entry': nb_entry}
+        with open(manifest_fileName + '.tmp', 'w') as fid:
+            json.dump(manifest, fid, indent=4, default=F_json_default)
+        os.replace(manifest_fileName + '.tmp', manifest_fileName)
+
+        # --- files of the older generations (and of interrupted saves)
+        keep_fileName_s = previous_fileName_s | set(shard_fileName_l) | {index_fileName}
+        for fileName in glob.glob(os.path.join(dirName, 'shard_*.jsonl')) + glob.glob(os.path.join(dirName, 'index*.npz')):
+            if os.path.basename(fileName) not in keep_fileName_s:
+                os.remove(fileName)
+                if os.path.isfile(F_sidecar_fileName(fileName)):
+                    os.remove(F_sidecar_fileName(fileName))
+
+
+    # ===============================================
+    def M_open_sharded(self, dirName):
+        """
+        Open a sharded collection (written by M_save_sharded) for random access
+            the 'descriptiondefinition' are loaded, the entries stay on disk and are read by M_get_entry and M_get_entry_by_filepath
+        """
+
+        print("opening pyjama sharded collection: %s" % (dirName))
+        shard_store = C_pyjama_shard_store(dirName)
+        self.M_reset_collection(shard_store.schemaversion, copy.deepcopy(shard_store.descriptiondefinition), [])
+        self.shard_store = shard_store
+
+
+    # ===============================================
+    def M_get_entry(self, num_entry):
+        """
+        return the entry num_entry (read from disk if a sharded collection is open, see M_open_sharded)
+        """
+
+        if self.shard_store is not None:
+            return self.shard_store.M_get_entry(num_entry)
+        return self.data['collection']['entry'][num_entry]
+
+
+    # ===============================================
+    def M_get_entry_by_filepath(self, filepath):
+        """
+        return the entry with this 'filepath' value, None if there is no such entry
+            (read from disk if a sharded collection is open, see M_open_sharded)
+        """
+
+        if self.shard_store is not None:
+            return self.shard_store.M_get_entry_by_filepath(filepath)
+        num_entry = self.M_get_key_index().get(filepath)
+        if num_entry is None:
+            return None
+        return self.data['collection']['entry'][num_entry]
@@ -0,0 +1,88 @@
+import numpy as np
+
+import pyjama
+
+
+def F_build(not_valid_action='add_to_dictionary', nb_entry=3):
+    my = pyjama.C_pyjama(not_valid_action=not_valid_action)
+    my.M_add_definition('filepath')
+    my.M_add_definition('genre', type_constraint='value_in_dictionary', dictionary=['rock', 'jazz'])
+    my.M_add_definition('beat', type_extent='marker', type_content='numeric')
+    my.M_add_entries(nb_entry)
+    my.M_update_entries('filepath', value_l=[f'a{num_entry}.wav' for num_entry in range(nb_entry)])
+    return my
+
+
+def F_raises(F_call):
+    try:
+        F_call()
+    except Exception as exception:
+        return str(exception).startswith('ERROR')
+    return False
+
+
+def test_offsets():
+    my = F_build()
+    my.M_update_entries('beat', value_l=[1., 2., 3., 4.], time_l=[.5, 1., 1.5, 2.], offset_v=[0, 1, 1, 4])
+    entry_l = my.data['collection']['entry']
+    assert entry_l[0]['beat'] == [{'value': 1., 'time': .5}]
+    assert entry_l[1]['beat'] == []
+    assert [atom['time'] for atom in entry_l[2]['beat']] == [1., 1.5, 2.]
+
+    my.M_update_entries('beat', value_l=[5.], time_l=[3.], offset_v=[0, 1], filepath_l=['a1.wav'])
+    assert entry_l[1]['beat'] == [{'value': 5., 'time': 3.}]
+    my.M_update_entries('beat', value_l=np.array([6., 7.]), time_l=np.array([4., 5.]), offset_v=[0, 2], entry_index_v=[0])
+    assert [atom['value'] for atom in entry_l[0]['beat']] == [1., 6., 7.]
+
+
+def test_offset_checks():
+    my = F_build()
+    time_l = [.5, 1., 1.5]
+    assert F_raises(lambda: my.M_update_entries('beat', value_l=[1., 2., 3.], time_l=time_l, offset_v=[0, 2]))
+    assert F_raises(lambda: my.M_update_entries('beat', value_l=[1., 2., 3.], time_l=time_l, offset_v=[1, 3]))
+    assert F_raises(lambda: my.M_update_entries('beat', value_l=[1., 2., 3.], time_l=time_l, offset_v=[0, 2, 1, 3]))
+    assert F_raises(lambda: my.M_update_entries('beat', value_l=[1., 2., 3.], time_l=time_l, offset_v=[0, 3], entry_index_v=[0, 1]))
+    assert F_raises(lambda: my.M_update_entries('beat', value_l=[1., 2., 3.], time_l=time_l, offset_v=[0, 3], entry_index_v=[3]))
+    assert F_raises(lambda: my.M_update_entries('beat', value_l=[1., 2., 3.], time_l=[.5], offset_v=[0, 3]))
+    assert F_raises(lambda: my.M_update_entries('beat', value_l=[1., 2., 3.], offset_v=[0, 3]))
+    assert all(entry['beat'] == [] for entry in my.data['collection']['entry'])
+
+
+def test_filter_out():
+    my = F_build('filter_out')
+    my.M_update_entries('genre', value_l=['rock', 'pop', 'jazz', 'funk'], offset_v=[0, 2, 2, 4])
+    entry_l = my.data['collection']['entry']
+    assert entry_l[0]['genre'] == [{'value': 'rock'}]
+    assert entry_l[1]['genre'] == []
+    assert entry_l[2]['genre'] == [{'value': 'jazz'}]
+    assert my.data['collection']['descriptiondefinition']['genre']['dictionary'] == ['rock', 'jazz']
+
+
+def test_reject_and_add_to_dictionary():
+    my = F_build('reject')
+    assert F_raises(lambda: my.M_update_entries('genre', value_l=['rock', 'pop', 'jazz']))
+    assert all(entry['genre'] == [] for entry in my.data['collection']['entry'])
+
+    my = F_build()
+    my.M_update_entries('genre', value_l=['rock', 'pop', 'jazz'])
+    assert my.data['collection']['descriptiondefinition']['genre']['dictionary'] == ['rock', 'jazz', 'pop']
+
+
+def test_empty_batch():
+    for not_valid_action in ['add_to_dictionary', 'reject', 'filter_out']:
+        my = F_build(not_valid_action)
+        my.M_update_entries('genre', value_l=[], offset_v=[0, 0, 0, 0])
+        my.M_update_entries('beat', value_l=[], time_l=[], offset_v=[0, 0])
+        assert all(entry['genre'] == [] for entry in my.data['collection']['entry'])
+
+
+def test_import_empty_lab(tmp_path):
+    for suffix in ['.beat.lab', '.struct.lab']:
+        (tmp_path / ('audio1' + suffix)).write_text('')
+    my = pyjama.C_pyjama()
+    my.M_add_definition('filepath')
+    my.M_add_definition('beat', type_extent='marker', type_constraint='value_in_dictionary', dictionary=['A'])
+    my.M_add_definition('structtype', type_extent='segment', type_constraint='value_in_dictionary', dictionary=['verse'])
+    my.M_import_lab(str(tmp_path), {'beat': '.beat.lab', 'structtype': '.struct.lab'}, nb_worker=1)
+    entry, = my.data['collection']['entry']
+    assert entry['beat'] == [] and entry['structtype'] == []
@@ -0,0 +1,75 @@
+import json
+
+import pyjama
+
+
+def F_build(fill='eager'):
+    my = pyjama.C_pyjama(fill=fill)
+    my.M_add_definition('filepath')
+    my.M_add_definition('genre')
+    for num_entry in range(3):
+        my.M_add_entry()
+        my.M_update_entry('filepath', value_l=f'a{num_entry}.wav')
+    my.M_update_entry('genre', value_l='rock', num_entry=0)
+    return my
+
+
+def test_incremental_check():
+    my = F_build()
+    my.M_check()
+    entry_l = my.data['collection']['entry']
+    assert entry_l[1]['genre'] == [{'value': ''}]
+
+    # --- new definition: the checked entries are completed
+    my.M_add_definition('tempo', type_content='numeric')
+    my.M_add_entry()
+    my.M_update_entry('filepath', value_l='a3.wav')
+    my.M_check()
+    assert all(entry['tempo'] == [{'value': ''}] for entry in entry_l)
+    assert entry_l[3]['genre'] == [{'value': ''}]
+
+    # --- removed atoms: the entry is checked again
+    my.M_delete_atom('genre', num_entry=0)
+    assert entry_l[0]['genre'] == []
+    my.M_check()
+    assert entry_l[0]['genre'] == [{'value': ''}]
+
+    # --- direct modification of self.data: full check
+    del entry_l[2]['genre']
+    my.M_check()
+    assert 'genre' not in entry_l[2]
+    my.M_check(full=True)
+    assert entry_l[2]['genre'] == [{'value': ''}]
+
+
+def test_lazy_fill(tmp_path):
+    """
+    with fill='lazy' the entries are not modified, the missing descriptions are added when writing
+    """
+
+    eager = F_build()
+    eager.M_check()
+    my = F_build('lazy')
+    my.M_check()
+    assert my.data['collection']['entry'][1]['genre'] == []
+    assert list(my.M_iter_entries()) == eager.data['collection']['entry']
+    assert my.data['collection']['entry'][1]['genre'] == []
+
+    fileName = str(tmp_path / 'lazy.pyjama')
+    my.M_save(fileName)
+    with open(fileName, 'r') as fid:
+        saved = json.load(fid)
+    assert saved['collection']['entry'] == eager.data['collection']['entry']
+
+    # --- the compacted journal gives the same file
+    fileName = str(tmp_path / 'compact.pyjama')
+    my = F_build('lazy')
+    my.M_open_journal(fileName)
+    my.M_add_definition('tempo', type_content='numeric')
+    my.M_compact()
+    my.M_close_journal()
+    with open(fileName, 'r') as fid:
+        compacted = json.load(fid)
+    assert all(entry['tempo'] == [{'value': ''}] for entry in compacted['collection']['entry'])
+    assert compacted['collection']['entry'][1]['genre'] == [{'value': ''}]
+    assert 'tempo' not in my.data['collection']['entry'][0]
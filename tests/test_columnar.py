@@ -0,0 +1,55 @@
+import os
+import glob
+import json
+
+import numpy as np
+
+import pyjama
+from pyjama.pyjama import F_json_default
+
+
+def test_round_trip(tmp_path):
+    """
+    M_save_columnar then M_load_columnar gives back the collection of each example
+    """
+
+    fileName_l = sorted(glob.glob(os.path.join(os.path.dirname(pyjama.__file__), '_examples', '*.pyjama')))
+    assert fileName_l
+    for fileName in fileName_l:
+        my = pyjama.C_pyjama()
+        my.M_load(fileName)
+        my.M_save_columnar(str(tmp_path / 'collection.npz'))
+        other = pyjama.C_pyjama()
+        other.M_load_columnar(str(tmp_path / 'collection.npz'))
+        assert json.dumps(other.data, default=F_json_default) == json.dumps(my.data, default=F_json_default), fileName
+
+
+def test_round_trip_after_check(tmp_path):
+    """
+    numeric and breakpoint descriptions missing from some entries (empty 'value' of M_check), atoms without 'value'
+    """
+
+    for sidecar, is_checked in [(False, False), (False, True), (True, True)]:
+        my = pyjama.C_pyjama(sidecar=sidecar)
+        my.M_add_definition('filepath')
+        my.M_add_definition('tempo', type_content='numeric')
+        my.M_add_definition('beat', type_extent='marker', type_content='numeric')
+        my.M_add_definition('f0', type_extent='breakpoint', type_content='numeric', row_name=['f0'])
+        for num_entry in range(3):
+            my.M_add_entry()
+            my.M_update_entry('filepath', value_l=f'a{num_entry}.wav')
+        my.M_update_entry('tempo', value_l=120., num_entry=0)
+        my.M_update_entry('beat', time_l=1.5, num_entry=0)
+        my.M_update_entry('f0', value_l=np.ones((1, 4)) * 0.5, time_l=np.arange(4.) * 0.1, num_entry=1)
+        if is_checked:
+            my.M_check()
+
+        my.M_save_columnar(str(tmp_path / 'collection.npz'))
+        other = pyjama.C_pyjama(sidecar=sidecar)
+        other.M_load_columnar(str(tmp_path / 'collection.npz'))
+        reference = json.dumps(my.data, default=F_json_default)
+        assert json.dumps(other.data, default=F_json_default, allow_nan=False) == reference
+        if is_checked:
+            assert other.data['collection']['entry'][1]['tempo'] == [{'value': ''}]
+        else:
+            assert other.data['collection']['entry'][0]['beat'] == [{'time': 1.5}]
@@ -0,0 +1,103 @@
+import os
+
+import pyjama
+
+
+def F_build(tmp_path, not_valid_action='reject'):
+    my = pyjama.C_pyjama(not_valid_action=not_valid_action, filepath_check='deferred')
+    my.M_add_definition('filepath', type_constraint='filepath')
+    for name in ['a0.wav', 'missing.wav', 'a2.wav']:
+        my.M_add_entry()
+        my.M_update_entry('filepath', value_l=str(tmp_path / name))
+    return my
+
+
+def F_touch(fileName):
+    with open(fileName, 'w'):
+        pass
+
+
+def test_deferred_filter_out(tmp_path):
+    for name in ['a0.wav', 'a2.wav']:
+        F_touch(tmp_path / name)
+    my = F_build(tmp_path, 'filter_out')
+    assert len(my.pending_filepath_l) == 3
+    my.M_check_filepath()
+    entry_l = my.data['collection']['entry']
+    assert entry_l[0]['filepath'] == [{'value': str(tmp_path / 'a0.wav')}]
+    assert entry_l[1]['filepath'] == []
+    assert my.pending_filepath_l == []
+    my.M_check()
+    assert entry_l[1]['filepath'] == [{'value': ''}]
+
+
+def test_deferred_reject(tmp_path):
+    """
+    the invalid atoms stay pending: the next M_check (or M_save) raises again until the file exists
+    """
+
+    for name in ['a0.wav', 'a2.wav']:
+        F_touch(tmp_path / name)
+    my = F_build(tmp_path)
+    for num_call in range(2):
+        try:
+            my.M_check()
+        except Exception as exception:
+            assert 'missing.wav' in str(exception)
+        else:
+            assert False
+        try:
+            my.M_save(str(tmp_path / 'collection.pyjama'))
+        except Exception as exception:
+            assert 'missing.wav' in str(exception)
+        else:
+            assert False
+    assert not os.path.isfile(tmp_path / 'collection.pyjama')
+    assert my.data['collection']['entry'][1]['filepath'] == [{'value': str(tmp_path / 'missing.wav')}]
+
+    # --- a file created after the first check is accepted (missing files are not cached)
+    F_touch(tmp_path / 'missing.wav')
+    my.M_check()
+    assert my.pending_filepath_l == []
+    my.M_save(str(tmp_path / 'collection.pyjama'))
+
+
+def test_immediate(tmp_path):
+    F_touch(tmp_path / 'a0.wav')
+    my = pyjama.C_pyjama(not_valid_action='reject')
+    my.M_add_definition('filepath', type_constraint='filepath')
+    my.M_add_entry()
+    my.M_update_entry('filepath', value_l=str(tmp_path / 'a0.wav'))
+    my.M_add_entry()
+    try:
+        my.M_update_entry('filepath', value_l=str(tmp_path / 'a1.wav'))
+    except Exception as exception:
+        assert str(exception).startswith('ERROR')
+    else:
+        assert False
+    F_touch(tmp_path / 'a1.wav')
+    my.M_update_entry('filepath', value_l=str(tmp_path / 'a1.wav'))
+    assert my.data['collection']['entry'][1]['filepath'] == [{'value': str(tmp_path / 'a1.wav')}]
+
+
+def test_cache(tmp_path):
+    path = str(tmp_path / 'a0.wav')
+    F_touch(path)
+    checker = pyjama.pyjama.C_filepath_checker(ttl=10., nb_worker=4)
+    assert checker.M_is_file_d([path, str(tmp_path / 'missing.wav')]) == {path: True, str(tmp_path / 'missing.wav'): False}
+    assert list(checker.cache_d) == [path]
+
+    # --- the cached result is used until it expires or is invalidated
+    os.remove(path)
+    assert checker.M_is_file_d([path]) == {path: True}
+    check_time = checker.cache_d[path][1]
+    assert checker.M_get_cached(path, check_time + 5.) is True
+    assert checker.M_get_cached(path, check_time + 11.) is None
+    checker.M_invalidate(path)
+    assert checker.M_is_file_d([path]) == {path: False}
+
+    F_touch(path)
+    assert checker.M_is_file_d([path]) == {path: True}
+    os.remove(path)
+    checker.M_invalidate()
+    assert checker.M_is_file_d([path]) == {path: False}
@@ -0,0 +1,30 @@
+import pyjama
+
+
+def F_build():
+    my = pyjama.C_pyjama()
+    my.M_add_definition('beat', type_extent='marker')
+    my.M_add_entry()
+    my.M_update_entry('beat', time_l=1.0)
+    my.M_update_entry('beat', time_l=2.0)
+    return my
+
+
+def test_negative_num_entry():
+    my = F_build()
+    assert len(my.M_find_time('beat', 0., 10., num_entry=-1)) == 2
+    my.M_update_entry('beat', time_l=3.0)
+    found_l = my.M_find_time('beat', 0., 10., num_entry=-1)
+    assert [found['time'] for found in found_l] == [1., 2., 3.]
+    assert found_l[0]['entry'] == 0
+
+
+def test_check_after_find_time():
+    """
+    M_check replaces the atoms without 'value': the temporal indexes are dropped
+    """
+
+    my = F_build()
+    assert len(my.M_find_time('beat', 0., 10.)) == 2
+    my.M_check()
+    assert my.M_find_time('beat', 0., 10.) == []
@@ -0,0 +1,29 @@
+import pyjama
+from pyjama import pyjama as pyjama_module
+
+
+def F_build():
+    my = pyjama.C_pyjama()
+    my.M_add_definition('genre', type_constraint='value_in_dictionary', dictionary=['rock'])
+    return my
+
+
+def test_independent_instances():
+    """
+    two instrumented C_pyjama stopped in non-LIFO order: each one counts its own calls, the module is not modified
+    """
+
+    first, second = F_build(), F_build()
+    first_instrumentation = first.M_start_instrumentation()
+    second_instrumentation = second.M_start_instrumentation()
+    first.M_add_entry()
+    first.M_update_entry('genre', value_l='rock')
+    first.M_stop_instrumentation()
+    second.M_stop_instrumentation()
+
+    assert first_instrumentation.count_d['F_check_value_in_dictionary'] == 1
+    assert 'F_check_value_in_dictionary' not in second_instrumentation.count_d
+    for name in pyjama_module.INSTRUMENTED_FUNCTION_L:
+        assert not hasattr(getattr(pyjama_module, name), '__wrapped__')
+        for description in first.description_d.values():
+            assert name not in description.__dict__
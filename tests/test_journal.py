@@ -0,0 +1,93 @@
+import os
+import json
+
+import numpy as np
+
+import pyjama
+from pyjama.pyjama import F_json_default
+
+
+def F_build(fileName):
+    my = pyjama.C_pyjama(sidecar=True)
+    my.M_add_definition('genre', type_constraint='value_in_dictionary', dictionary=['rock'])
+    my.M_add_definition('f0', type_extent='breakpoint', row_name=['f0'])
+    my.M_open_journal(fileName)
+    for num_entry in range(3):
+        my.M_add_entry()
+        my.M_update_entry('genre', value_l='rock')
+        my.M_update_entry('f0', value_l=np.ones((1, 4)) * num_entry, time_l=np.arange(4.))
+    return my
+
+
+def F_dump(my):
+    return json.dumps(my.data, default=F_json_default, sort_keys=True)
+
+
+def test_crash_and_reopen(tmp_path):
+    """
+    definitions added before M_open_journal are recovered, twice in a row
+    """
+
+    fileName = str(tmp_path / 'collection.pyjama')
+    my = F_build(fileName)
+    reference = F_dump(my)
+    # --- crash: the journal is not closed, the collection file is never written
+
+    for num_crash in range(2):
+        recovered = pyjama.C_pyjama(sidecar=True)
+        recovered.M_open_journal(fileName)
+        assert F_dump(recovered) == reference
+        assert list(recovered.data['collection']['descriptiondefinition']) == ['genre', 'f0']
+    assert not os.path.isfile(fileName)
+
+
+def test_incomplete_last_line(tmp_path):
+    fileName = str(tmp_path / 'collection.pyjama')
+    my = F_build(fileName)
+    reference = F_dump(my)
+    my.M_close_journal()
+    with open(fileName + '.journal', 'a') as fid:
+        fid.write('{"op": "add_en')
+
+    recovered = pyjama.C_pyjama(sidecar=True)
+    recovered.M_open_journal(fileName)
+    assert F_dump(recovered) == reference
+    recovered.M_add_entry()
+    recovered.M_close_journal()
+
+    recovered = pyjama.C_pyjama(sidecar=True)
+    recovered.M_open_journal(fileName)
+    assert len(recovered.data['collection']['entry']) == 4
+
+
+def test_compact(tmp_path):
+    fileName = str(tmp_path / 'collection.pyjama')
+    my = F_build(fileName)
+    reference = F_dump(my)
+    my.M_compact()
+    assert os.path.getsize(fileName + '.journal') == 0
+    my.M_close_journal()
+
+    recovered = pyjama.C_pyjama(sidecar=True)
+    recovered.M_open_journal(fileName)
+    assert F_dump(recovered) == reference
+
+
+def test_replay_after_check(tmp_path):
+    """
+    the empty 'value' created by M_check and then replaced gives the same collection when replayed
+    """
+
+    fileName = str(tmp_path / 'collection.pyjama')
+    my = F_build(fileName)
+    my.M_add_definition('tempo', type_content='numeric')
+    my.M_check()
+    my.M_update_entry('tempo', value_l=120., num_entry=0)
+    my.M_replace_atom('tempo', 0, value_l=90., num_entry=1)
+    reference = F_dump(my)
+    assert my.data['collection']['entry'][1]['tempo'] == [{'value': 90.}]
+    my.M_close_journal()
+
+    recovered = pyjama.C_pyjama(sidecar=True)
+    recovered.M_open_journal(fileName)
+    assert F_dump(recovered) == reference
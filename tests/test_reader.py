@@ -0,0 +1,32 @@
+import os
+import glob
+import json
+
+import pyjama
+
+
+def test_chunk_size():
+    """
+    the streaming reader gives the same collection whatever the chunk boundaries (numbers split over two chunks)
+    """
+
+    fileName_l = sorted(glob.glob(os.path.join(os.path.dirname(pyjama.__file__), '_examples', '*.pyjama')))
+    assert fileName_l
+    for fileName in fileName_l:
+        with open(fileName, 'r') as fid:
+            data = json.load(fid)
+        for chunk_size in [1, 2, 3, 5, 7, 1 << 16]:
+            with pyjama.C_pyjama_reader(fileName, chunk_size=chunk_size) as reader:
+                assert reader.schemaversion == data['schemaversion'], (fileName, chunk_size)
+                assert reader.descriptiondefinition == data['collection']['descriptiondefinition']
+                assert list(reader) == data['collection']['entry'], (fileName, chunk_size)
+
+
+def test_load_resets_definitions():
+    dirName = os.path.join(os.path.dirname(pyjama.__file__), '_examples')
+    my = pyjama.C_pyjama()
+    my.M_load(os.path.join(dirName, 'example_breakpoint_time_value.pyjama'))
+    assert my.extent_name_d.get('breakpoint_time')
+    my.M_load(os.path.join(dirName, 'example_segment.pyjama'))
+    assert set(my.description_d) == set(my.data['collection']['descriptiondefinition'])
+    assert 'breakpoint_time' not in my.extent_name_d
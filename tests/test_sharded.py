@@ -0,0 +1,88 @@
+import os
+
+import numpy as np
+
+import pyjama
+
+
+def F_build(nb_entry, offset=0.):
+    my = pyjama.C_pyjama(sidecar=True)
+    my.M_add_definition('filepath', type_constraint='free')
+    my.M_add_definition('f0', type_extent='breakpoint', row_name=['f0'])
+    for num_entry in range(nb_entry):
+        my.M_add_entry()
+        my.M_update_entry('filepath', value_l=f'audio{num_entry}.wav')
+        my.M_update_entry('f0', value_l=np.ones((1, 4)) * num_entry + offset, time_l=np.arange(4.))
+    my.M_check()
+    return my
+
+
+def test_save_while_open(tmp_path):
+    """
+    a store opened before a new save keeps reading the entries of its own generation
+    """
+
+    dirName = str(tmp_path / 'collection')
+    F_build(5).M_save_sharded(dirName, nb_entry_per_shard=2)
+    with pyjama.C_pyjama_shard_store(dirName) as store:
+        assert store.M_get_entry(4)['f0'][0]['value'][0][0] == 4.
+        F_build(3, offset=100.).M_save_sharded(dirName, nb_entry_per_shard=2)
+        assert len(store) == 5
+        assert store.M_get_entry(4)['f0'][0]['value'][0][0] == 4.
+        assert store.M_get_entry_by_filepath('audio1.wav')['f0'][0]['value'][0][0] == 1.
+
+    with pyjama.C_pyjama_shard_store(dirName) as store:
+        assert len(store) == 3
+        assert store.M_get_entry(1)['f0'][0]['value'][0][0] == 101.
+
+
+def test_old_generations_removed(tmp_path):
+    dirName = str(tmp_path / 'collection')
+    for num_save in range(3):
+        F_build(5).M_save_sharded(dirName, nb_entry_per_shard=2)
+    fileName_l = sorted(os.listdir(dirName))
+    assert 'index_00000.npz' not in fileName_l
+    assert 'index_00001.npz' in fileName_l and 'index_00002.npz' in fileName_l
+    assert not any(fileName.startswith('shard_00000_') for fileName in fileName_l)
+
+
+def test_get_breakpoint(tmp_path):
+    dirName = str(tmp_path / 'collection')
+    F_build(5).M_save_sharded(dirName, nb_entry_per_shard=2)
+    my = pyjama.C_pyjama(sidecar=True)
+    my.M_open_sharded(dirName)
+    assert np.all(my.M_get_breakpoint('f0', 0., 3., num_entry=2)['mean'] == 2.)
+    assert np.all(my.M_get_breakpoint('f0', 0., 3., filepath='audio3.wav')['mean'] == 3.)
+    for arg_d in [{}, {'filepath': 'missing.wav'}]:
+        try:
+            my.M_get_breakpoint('f0', 0., 3., **arg_d)
+        except Exception as exception:
+            assert str(exception).startswith('ERROR')
+        else:
+            assert False
+
+
+def test_replaced_collection(tmp_path):
+    """
+    the sharded collection is closed when the collection is replaced
+    """
+
+    dirName = str(tmp_path / 'collection')
+    F_build(5).M_save_sharded(dirName, nb_entry_per_shard=2)
+    fileName = str(tmp_path / 'other.pyjama')
+    other = F_build(2, offset=100.)
+    other.M_save(fileName)
+
+    my = pyjama.C_pyjama(sidecar=True)
+    my.M_open_sharded(dirName)
+    assert my.M_get_entry(4)['filepath'][0]['value'] == 'audio4.wav'
+    my.M_load(fileName)
+    assert my.shard_store is None
+    assert my.M_get_entry(0) is my.data['collection']['entry'][0]
+    assert np.all(my.M_get_breakpoint('f0', 0., 3., num_entry=1)['mean'] == 101.)
+    assert my.M_get_entry_by_filepath('audio4.wav') is None
+
+    my.M_open_sharded(dirName)
+    my.M_save_columnar(str(tmp_path / 'empty.npz'))
+    my.M_load_columnar(str(tmp_path / 'empty.npz'))
+    assert my.shard_store is None
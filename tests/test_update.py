@@ -0,0 +1,80 @@
+import pyjama
+
+
+def F_build(nb_entry=3):
+    my = pyjama.C_pyjama()
+    my.M_add_definition('filepath')
+    for num_entry in range(nb_entry):
+        my.M_add_entry()
+        my.M_update_entry('filepath', value_l=f'a{num_entry}.wav')
+    return my
+
+
+def test_update_existing_entries():
+    """
+    a description defined after the entries is updated by num_entry and by filepath
+    """
+
+    my = F_build()
+    my.M_add_definition('tempo', type_content='numeric')
+    my.M_update_entry('tempo', value_l=120.0, num_entry=0)
+    my.M_update_entry('tempo', value_l=121.0, filepath='a1.wav')
+    entry_l = my.data['collection']['entry']
+    assert entry_l[0]['tempo'] == [{'value': 120.0}]
+    assert entry_l[1]['tempo'] == [{'value': 121.0}]
+    assert 'tempo' not in entry_l[2]
+
+
+def test_update_after_check():
+    """
+    the empty 'value' created by M_check is replaced by the first atom
+    """
+
+    my = F_build()
+    my.M_add_definition('tempo', type_content='numeric', is_filter=True)
+    my.M_check()
+    assert my.M_select(tempo=121.0) == []
+    my.M_update_entry('tempo', value_l=121.0, filepath='a1.wav')
+    my.M_update_entries('tempo', value_l=[90.0, 91.0], entry_index_v=[2], offset_v=[0, 2])
+    entry_l = my.data['collection']['entry']
+    assert entry_l[0]['tempo'] == [{'value': ''}]
+    assert entry_l[1]['tempo'] == [{'value': 121.0}]
+    assert entry_l[2]['tempo'] == [{'value': 90.0}, {'value': 91.0}]
+    assert my.M_select(tempo=121.0) == [1]
+
+
+def test_replace_and_delete_atom():
+    my = F_build()
+    my.M_add_definition('genre')
+    for value in ['rock', 'jazz', 'pop']:
+        my.M_update_entry('genre', value_l=value, num_entry=1)
+    my.M_replace_atom('genre', 1, value_l='blues', filepath='a1.wav')
+    assert [atom['value'] for atom in my.data['collection']['entry'][1]['genre']] == ['rock', 'blues', 'pop']
+    my.M_delete_atom('genre', 0, num_entry=1)
+    assert [atom['value'] for atom in my.data['collection']['entry'][1]['genre']] == ['blues', 'pop']
+    my.M_delete_atom('genre', filepath='a1.wav')
+    assert my.data['collection']['entry'][1]['genre'] == []
+
+    # --- the empty 'value' of M_check is replaced
+    my.M_check()
+    my.M_replace_atom('genre', 0, value_l='soul', num_entry=0)
+    assert my.data['collection']['entry'][0]['genre'] == [{'value': 'soul'}]
+
+    try:
+        my.M_replace_atom('genre', 3, value_l='soul', num_entry=0)
+    except Exception as exception:
+        assert str(exception).startswith('ERROR')
+    else:
+        assert False
+
+
+def test_filepath_key_after_replace():
+    my = F_build()
+    my.M_replace_atom('filepath', 0, value_l='b1.wav', filepath='a1.wav')
+    assert my.M_get_num_entry(filepath='b1.wav') == 1
+    try:
+        my.M_get_num_entry(filepath='a1.wav')
+    except Exception as exception:
+        assert str(exception).startswith('ERROR')
+    else:
+        assert False